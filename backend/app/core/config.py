@@ -36,6 +36,12 @@ class Settings(BaseSettings):
     # Session Configuration
     session_ttl_hours: int = 24
     max_concurrent_sessions: int = 100
+    max_in_memory_sessions: int = 1000
+    max_batch_sessions: int = 100
+    # Test/dev only: lets clients create "ephemeral" sessions that skip Redis.
+    # They are process-local, so only enable this with a single worker
+    allow_ephemeral_sessions: bool = False
+    ephemeral_session_ttl_seconds: int = 10
     
     # Security
     secret_key: str = "your-secret-key-change-in-production"
@@ -55,6 +61,7 @@ class Settings(BaseSettings):
     enable_audio_processing: bool = True
     enable_image_analysis: bool = True
     enable_video_analysis: bool = True
+    hedged_search: bool = False  # Query SerpAPI and Bing concurrently (doubles search API usage)
     
     # Performance Tuning
     max_ocr_text_length: int = 1200
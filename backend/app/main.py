@@ -5,7 +5,7 @@ import json
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 import uuid
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks
@@ -18,12 +18,14 @@ from app.models.schemas import (
     FrameBundle, SessionMemory, WSMessage, WSMessageType,
     NotificationPayload, SessionSettings, ErrorResponse, ErrorType, 
     ErrorSeverity, ValidationErrorResponse, ValidationErrorField, WebSocketErrorMessage,
-    SessionControlMessage, SessionStatusMessage, HeartbeatMessage
+    SessionControlMessage, SessionStatusMessage, HeartbeatMessage,
+    BatchSessionCreateRequest
 )
 from app.services.session_service import session_manager, websocket_manager
 from app.services.bedrock_service import orchestrator
 from app.services.redis_starter import redis_starter
 from app.services.error_recovery_service import error_recovery_service
+from app.services.http_client import close_session as close_http_session
 
 
 # Configure logging
@@ -59,6 +61,9 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
     
+    await session_manager.shutdown()
+    await close_http_session()
+    
     # Optionally stop Redis container (uncomment if you want auto-cleanup)
     # redis_starter.stop_redis_container()
 
@@ -114,6 +119,35 @@ async def health_check():
     }
 
 
+def _session_validation_error(ve: ValidationError) -> Dict[str, Any]:
+    """Build the 422 detail body for invalid session settings."""
+    field_errors = [
+        ValidationErrorField(
+            field=str(error["loc"][-1]) if error["loc"] else "unknown",
+            message=error["msg"],
+            invalid_value=error.get("input")
+        )
+        for error in ve.errors()
+    ]
+    validation_error = ValidationErrorResponse(
+        severity=ErrorSeverity.LOW,
+        message="Invalid session settings provided",
+        field_errors=field_errors
+    )
+    return validation_error.model_dump(by_alias=True)
+
+
+def _session_create_error(e: Exception) -> Dict[str, Any]:
+    """Build the 500 detail body for a session that could not be created."""
+    error_response = ErrorResponse(
+        error_type=ErrorType.INTERNAL_ERROR,
+        severity=ErrorSeverity.HIGH,
+        message="Failed to create session",
+        details=str(e)
+    )
+    return error_response.model_dump(by_alias=True)
+
+
 @app.post("/sessions")
 async def create_session(session_settings: Dict[str, Any]):
     """Create a new fact-checking session."""
@@ -126,35 +160,148 @@ async def create_session(session_settings: Dict[str, Any]):
         return {
             "session_id": session_id,
             "settings": session_memory.settings.model_dump(by_alias=True),
+            "ephemeral": session_manager.is_ephemeral(session_id),
             "created_at": datetime.utcnow().isoformat()
         }
     
     except ValidationError as ve:
         logger.error(f"Validation error creating session: {ve}")
-        field_errors = [
-            ValidationErrorField(
-                field=str(error["loc"][-1]) if error["loc"] else "unknown",
-                message=error["msg"],
-                invalid_value=error.get("input")
-            )
-            for error in ve.errors()
-        ]
-        validation_error = ValidationErrorResponse(
-            severity=ErrorSeverity.LOW,
-            message="Invalid session settings provided",
-            field_errors=field_errors
-        )
-        raise HTTPException(status_code=422, detail=validation_error.model_dump(by_alias=True))
+        raise HTTPException(status_code=422, detail=_session_validation_error(ve))
     
     except Exception as e:
         logger.error(f"Failed to create session: {e}")
+        raise HTTPException(status_code=500, detail=_session_create_error(e))
+
+
+async def _require_settings_template(template_id: str) -> SessionSettings:
+    """Return a stored settings template or raise a 404."""
+    template = await session_manager.get_settings_template(template_id)
+    if template is None:
         error_response = ErrorResponse(
-            error_type=ErrorType.INTERNAL_ERROR,
-            severity=ErrorSeverity.HIGH,
-            message="Failed to create session",
-            details=str(e)
+            error_type=ErrorType.SESSION_NOT_FOUND,
+            severity=ErrorSeverity.LOW,
+            message=f"Settings template {template_id} not found or expired"
         )
-        raise HTTPException(status_code=500, detail=error_response.model_dump(by_alias=True))
+        raise HTTPException(status_code=404, detail=error_response.model_dump(by_alias=True))
+    return template
+
+
+@app.post("/sessions/templates")
+async def create_settings_template(session_settings: Dict[str, Any]):
+    """Validate session settings once and store them as a reusable template."""
+    try:
+        template_id = str(uuid.uuid4())
+        template = await session_manager.create_settings_template(template_id, session_settings)
+    except ValidationError as ve:
+        logger.error(f"Validation error creating settings template: {ve}")
+        raise HTTPException(status_code=422, detail=_session_validation_error(ve))
+    
+    return {
+        "template_id": template_id,
+        "settings": template.model_dump(by_alias=True)
+    }
+
+
+@app.post("/sessions/from-template")
+async def create_session_from_template(payload: Dict[str, Any]):
+    """Create a session from a stored template plus per-session overrides.
+    
+    Only the overridden fields are validated; everything else comes from the
+    already-validated template.
+    """
+    template = await _require_settings_template(payload.get("template_id"))
+    try:
+        session_id = str(uuid.uuid4())
+        session_memory = await session_manager.create_session_from_template(
+            session_id, template, payload.get("overrides") or {}
+        )
+        
+        logger.info(f"Created session {session_id} from template")
+        
+        return {
+            "session_id": session_id,
+            "settings": session_memory.settings.model_dump(by_alias=True),
+            "ephemeral": session_manager.is_ephemeral(session_id),
+            "created_at": datetime.utcnow().isoformat()
+        }
+    
+    except ValidationError as ve:
+        logger.error(f"Validation error creating session from template: {ve}")
+        raise HTTPException(status_code=422, detail=_session_validation_error(ve))
+    
+    except Exception as e:
+        logger.error(f"Failed to create session from template: {e}")
+        raise HTTPException(status_code=500, detail=_session_create_error(e))
+
+
+@app.post("/sessions/batch")
+async def create_sessions(payload: Dict[str, Any]):
+    """Create several sessions in one request.
+    
+    Each entry of ``sessions`` is validated on its own; the response carries one
+    result per entry, in order, with the status a single POST /sessions would
+    have returned. When ``template_id`` is given, entries are overrides applied
+    to that settings template instead of full settings.
+    """
+    try:
+        request = BatchSessionCreateRequest.model_validate(payload)
+    except ValidationError as ve:
+        raise HTTPException(status_code=422, detail=_session_validation_error(ve))
+    session_settings_list = request.sessions
+    if len(session_settings_list) > settings.max_batch_sessions:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.max_batch_sessions} sessions can be created per batch"
+        )
+    
+    session_ids = [str(uuid.uuid4()) for _ in session_settings_list]
+    if request.template_id is not None:
+        template = await _require_settings_template(request.template_id)
+        creations = [
+            session_manager.create_session_from_template(session_id, template, overrides)
+            for session_id, overrides in zip(session_ids, session_settings_list)
+        ]
+    else:
+        creations = [
+            session_manager.create_session(session_id, session_settings)
+            for session_id, session_settings in zip(session_ids, session_settings_list)
+        ]
+    outcomes = await asyncio.gather(*creations, return_exceptions=True)
+    
+    created_at = datetime.utcnow().isoformat()
+    results = []
+    for session_id, outcome in zip(session_ids, outcomes):
+        if isinstance(outcome, ValidationError):
+            results.append({"status": 422, "detail": _session_validation_error(outcome)})
+        elif isinstance(outcome, Exception):
+            logger.error(f"Failed to create session in batch: {outcome}")
+            results.append({"status": 500, "detail": _session_create_error(outcome)})
+        else:
+            results.append({
+                "status": 200,
+                "session_id": session_id,
+                "settings": outcome.settings.model_dump(by_alias=True),
+                "ephemeral": session_manager.is_ephemeral(session_id),
+                "created_at": created_at
+            })
+    
+    logger.info(f"Batch created {sum(r['status'] == 200 for r in results)}/{len(results)} sessions")
+    return {"results": results}
+
+
+@app.delete("/sessions/batch")
+async def delete_sessions(payload: Dict[str, Any]):
+    """Delete several sessions in one request."""
+    session_ids: List[str] = payload.get("session_ids")
+    if not isinstance(session_ids, list):
+        raise HTTPException(status_code=422, detail="'session_ids' must be a list of session ids")
+    await session_manager.delete_sessions(session_ids)
+    for session_id in session_ids:
+        await websocket_manager.disconnect(session_id)
+    
+    logger.info(f"Deleted {len(session_ids)} sessions")
+    
+    return {"message": "Sessions deleted", "count": len(session_ids)}
 
 
 @app.get("/sessions/{session_id}")
@@ -375,7 +522,7 @@ async def handle_session_status_request(session_id: str, websocket: WebSocket):
                 "memory": result.data.model_dump(by_alias=True),
                 "connection_health": {
                     "connected_at": websocket_manager.connections[session_id].connected_at.isoformat() if session_id in websocket_manager.connections else None,
-                    "last_heartbeat": websocket_manager.connections[session_id].last_heartbeat.isoformat() if session_id in websocket_manager.connections else None
+                    "last_heartbeat": websocket_manager.connections[session_id].last_heartbeat_at.isoformat() if session_id in websocket_manager.connections else None
                 }
             }
         else:
@@ -425,12 +572,25 @@ async def process_frame_bundle(session_id: str, data: Dict[str, Any], websocket:
             return
         
         session_memory = result.data
+        prior_timeline_len = len(session_memory.timeline)
         
         # Process through agent orchestrator
         manager_response = await orchestrator.process_frame(session_memory, frame_bundle)
+        updated_memory = manager_response.updated_memory
         
         # Update session memory
-        update_result = await session_manager.update_session(session_id, manager_response.updated_memory)
+        if len(updated_memory.timeline) >= prior_timeline_len:
+            # Rewrite only the session document and append the new timeline events
+            update_result = await session_manager.update_session(
+                session_id, updated_memory, include_timeline=False
+            )
+            for event in updated_memory.timeline[prior_timeline_len:]:
+                append_result = await session_manager.append_timeline_event(session_id, event)
+                if not append_result.success:
+                    logger.error(f"Failed to append timeline event for session {session_id}: {append_result.error}")
+        else:
+            # The timeline came back shorter, so it has to be rewritten whole
+            update_result = await session_manager.update_session(session_id, updated_memory)
         if not update_result.success:
             # Log error but don't fail the whole operation
             logger.error(f"Failed to update session {session_id}: {update_result.error}")
@@ -644,6 +804,15 @@ async def get_circuit_breaker_status():
                 "failure_threshold": breaker.failure_threshold
             }
         
+        # Outbound tool providers keep their own breakers
+        from app.services.tools import tools
+        for operation, breaker in tools.circuit_breakers.items():
+            status = breaker.status()
+            for key in ("last_failure_time", "next_attempt_time"):
+                if status[key] is not None:
+                    status[key] = datetime.utcfromtimestamp(status[key]).isoformat()
+            circuit_breakers[operation] = status
+        
         return {
             "circuit_breakers": circuit_breakers,
             "total_breakers": len(circuit_breakers)
@@ -659,6 +828,8 @@ async def reset_circuit_breaker(operation: str):
     """Reset a specific circuit breaker."""
     from app.services.error_recovery_service import error_recovery_service
     
+    from app.services.tools import tools
+    
     try:
         if operation in error_recovery_service.circuit_breakers:
             error_recovery_service._reset_circuit_breaker(operation)
@@ -666,6 +837,12 @@ async def reset_circuit_breaker(operation: str):
                 "success": True,
                 "message": f"Circuit breaker for {operation} has been reset"
             }
+        elif operation in tools.circuit_breakers:
+            tools.circuit_breakers[operation].reset()
+            return {
+                "success": True,
+                "message": f"Circuit breaker for {operation} has been reset"
+            }
         else:
             raise HTTPException(status_code=404, detail=f"Circuit breaker for {operation} not found")
             
@@ -110,6 +110,22 @@ class SessionSettings(BaseModel):
         populate_by_name = True
 
 
+class SessionSettingsOverrides(BaseModel):
+    """Fields to replace on a session settings template; unset fields are kept."""
+    session_type: Optional[SessionTypeConfig] = Field(None, alias="sessionType")
+    strictness: Optional[float] = Field(None, ge=0.0, le=1.0)
+    notify: Optional[NotificationSettings] = None
+
+    class Config:
+        populate_by_name = True
+
+
+class BatchSessionCreateRequest(BaseModel):
+    """Body of POST /sessions/batch; entries are validated per session later."""
+    sessions: List[Dict[str, Any]]
+    template_id: Optional[str] = None
+
+
 class TimelineEvent(BaseModel):
     t: str = Field(..., description="Time in mm:ss format")
     event: str = Field(..., description="Description of what happened")
@@ -585,6 +601,7 @@ class YouTubeMetadata(BaseModel):
     published_at: Optional[datetime] = Field(None, alias="publishedAt")
     view_count: Optional[int] = Field(None, alias="viewCount")
     like_count: Optional[int] = Field(None, alias="likeCount")
+    tier: Optional[str] = Field(default=None, description="Source reliability tier (A/B/C)")
 
     class Config:
         populate_by_name = True
\ No newline at end of file
@@ -5,6 +5,7 @@ import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Union
 import boto3
+import orjson
 from botocore.exceptions import ClientError
 from app.core.config import settings
 from app.models.schemas import (
@@ -69,11 +70,11 @@ class BedrockService:
         try:
             response = self.client.invoke_model(
                 modelId=model_id,
-                body=json.dumps(body),
+                body=orjson.dumps(body),
                 contentType="application/json"
             )
             
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
             return response_body
         
         except ClientError as e:
@@ -463,9 +463,10 @@ class ErrorRecoveryService:
         """Check network connectivity."""
         try:
             import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://httpbin.org/status/200", timeout=5) as response:
-                    return response.status == 200
+            from .http_client import get_session
+            session = await get_session()
+            async with session.get("https://httpbin.org/status/200", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                return response.status == 200
         except:
             return False
     
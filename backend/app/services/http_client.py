@@ -0,0 +1,72 @@
+"""Shared aiohttp client session for outbound API calls."""
+
+import asyncio
+import sys
+from typing import Optional
+
+import orjson
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import aiodns  # noqa: F401 - enables aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+
+_session: Optional["aiohttp.ClientSession"] = None
+_session_lock = asyncio.Lock()
+
+
+def _make_resolver() -> Optional["aiohttp.AsyncResolver"]:
+    """Return a c-ares resolver when aiodns can run on the current loop.
+
+    aiodns needs a selector loop; on Windows the default ProactorEventLoop
+    lacks add_reader, so fall back to aiohttp's threaded resolver there.
+    """
+    if aiodns is None:
+        return None
+    if sys.platform == "win32" and not isinstance(asyncio.get_running_loop(), asyncio.SelectorEventLoop):
+        return None
+    return aiohttp.AsyncResolver()
+
+
+async def get_session() -> "aiohttp.ClientSession":
+    """Return the process-wide client session, creating it on first use.
+
+    Reusing one session keeps connections, DNS lookups and TLS sessions pooled
+    across tool calls instead of paying the handshake on every request.
+    """
+    global _session
+    if _session is not None and not _session.closed:
+        return _session
+
+    async with _session_lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    # Fact-check crawls and search fan-out hit the same few hosts
+                    limit_per_host=64,
+                    keepalive_timeout=75,
+                    # Resolve on the event loop with c-ares instead of a
+                    # getaddrinfo thread when aiodns is installed
+                    resolver=_make_resolver(),
+                    ttl_dns_cache=300,
+                    use_dns_cache=True,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=5),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+    return _session
+
+
+async def close_session():
+    """Close the shared client session on application shutdown."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -1,26 +1,89 @@
 """Session management service for handling active fact-checking sessions."""
 
-import json
 import asyncio
+import heapq
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from itertools import islice
+from typing import Dict, Optional, List, Tuple, Union
+import orjson
 import redis.asyncio as aioredis
+from pydantic import BaseModel
+from cachetools import TTLCache
 from app.core.config import settings
 from app.models.schemas import (
-    SessionMemory, FrameBundle, SessionSettings, SessionType,
+    SessionMemory, FrameBundle, SessionSettings, SessionSettingsOverrides, SessionType, TimelineEvent,
     NotificationSettings, SessionTypeConfig, ErrorResponse, ErrorType, 
-    ErrorSeverity, SessionOperationResult, WSMessageType, HeartbeatMessage,
+    ErrorSeverity, SessionOperationResult, WSMessageType,
     EnhancedErrorResponse
 )
 from .error_recovery_service import error_recovery_service, RetryConfig
 
 
+_HEARTBEAT_TYPE = WSMessageType.HEARTBEAT.value
+
+
+def _encode_heartbeat() -> bytes:
+    """Encode a HeartbeatMessage without building and dumping the model."""
+    return orjson.dumps({
+        "type": _HEARTBEAT_TYPE,
+        "data": {"status": "alive"},
+        "timestamp": datetime.utcnow()
+    })
+
+
 class SessionManager:
     """Manages active fact-checking sessions."""
     
     def __init__(self):
         self.redis = None
-        self.sessions: Dict[str, SessionMemory] = {}  # In-memory fallback
+        # In-memory fallback, bounded so it cannot grow without limit while Redis is down
+        self.sessions: TTLCache = TTLCache(
+            maxsize=settings.max_in_memory_sessions,
+            ttl=settings.session_ttl_hours * 3600
+        )
+        
+        # Min-heap of (expiry_time, session_id) for in-memory TIME sessions, with
+        # the currently scheduled expiry per session to recognize stale entries
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        self._expiry_at: Dict[str, datetime] = {}
+        # When each in-memory session was first stored, which TIME limits count from
+        self._started_at: TTLCache = TTLCache(
+            maxsize=settings.max_in_memory_sessions,
+            ttl=settings.session_ttl_hours * 3600
+        )
+        
+        # Number of timeline events known to be in Redis per session, so writes
+        # only push the new ones; a missing entry forces a full timeline rewrite.
+        # Bounded like sessions so entries of Redis-expired sessions age out
+        self._timeline_len: TTLCache = TTLCache(
+            maxsize=settings.max_in_memory_sessions,
+            ttl=settings.session_ttl_hours * 3600
+        )
+        
+        # Write-combining buffer: session writes arriving close together are
+        # flushed to Redis in a single pipeline round trip
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._flush_task = None
+        self._write_batch_size = 64
+        self._write_flush_interval = 0.001  # seconds
+        self._offload_serialization_threshold = 500  # timeline events + past contents
+        
+        # Sessions created with "ephemeral": true (when allow_ephemeral_sessions is
+        # on) live only here, expire on their own after a few seconds and are
+        # never written to Redis
+        self._ephemeral_sessions: TTLCache = TTLCache(
+            maxsize=settings.max_in_memory_sessions,
+            ttl=settings.ephemeral_session_ttl_seconds
+        )
+        
+        # Validated settings that clients create sessions from by sending only
+        # the fields that differ. Stored in Redis so every worker sees them;
+        # this is the per-process copy (and the fallback without Redis)
+        self._settings_templates: TTLCache = TTLCache(
+            maxsize=256,
+            ttl=settings.session_ttl_hours * 3600
+        )
     
     async def initialize(self):
         """Initialize Redis connection."""
@@ -31,6 +94,27 @@ class SessionManager:
         except Exception as e:
             print(f"Redis connection failed, using in-memory storage: {e}")
             self.redis = None
+        
+        if self.redis and self._flush_task is None:
+            self._write_queue = asyncio.Queue()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def shutdown(self):
+        """Flush pending writes and stop the background writer."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        if self._write_queue:
+            pending = []
+            while not self._write_queue.empty():
+                pending.append(self._write_queue.get_nowait())
+            if pending:
+                await self._flush_writes(pending)
     
     async def create_session(
         self,
@@ -38,24 +122,80 @@ class SessionManager:
         settings_data: Dict[str, any]
     ) -> SessionMemory:
         """Create a new fact-checking session with error recovery."""
+        session_memory = self._build_session_memory(settings_data)
+        return await self._save_new_session(session_id, session_memory, self._wants_ephemeral(settings_data))
+    
+    async def create_settings_template(self, template_id: str, settings_data: Dict[str, any]) -> SessionSettings:
+        """Validate settings once and keep them for template-based session creation."""
+        template = self._parse_settings(settings_data)
+        self._settings_templates[template_id] = template
+        if self.redis:
+            try:
+                await self.redis.setex(
+                    f"session_template:{template_id}",
+                    timedelta(hours=settings.session_ttl_hours),
+                    template.model_dump_json(by_alias=True)
+                )
+            except Exception as e:
+                print(f"Redis template store error: {e}")
+        return template
+    
+    async def get_settings_template(self, template_id: str) -> Optional[SessionSettings]:
+        """Return a stored settings template, or None if unknown or expired."""
+        template = self._settings_templates.get(template_id)
+        if template is None and self.redis:
+            try:
+                data = await self.redis.get(f"session_template:{template_id}")
+            except Exception as e:
+                print(f"Redis template fetch error: {e}")
+                data = None
+            if data:
+                template = SessionSettings.model_validate_json(data)
+                self._settings_templates[template_id] = template
+        return template
+    
+    async def create_session_from_template(
+        self,
+        session_id: str,
+        template: SessionSettings,
+        overrides_data: Dict[str, any]
+    ) -> SessionMemory:
+        """Create a session from a template, validating only the overridden fields."""
+        overrides = SessionSettingsOverrides(**overrides_data)
+        session_settings = template.model_copy(
+            update={
+                name: getattr(overrides, name)
+                for name in overrides.model_fields_set
+                if getattr(overrides, name) is not None
+            }
+        )
+        session_memory = self._empty_session_memory(session_settings)
+        return await self._save_new_session(session_id, session_memory, self._wants_ephemeral(overrides_data))
+    
+    @staticmethod
+    def _wants_ephemeral(data: Dict[str, any]) -> bool:
+        """Whether a create request asks for an ephemeral session and may have one."""
+        return settings.allow_ephemeral_sessions and bool(data.get("ephemeral", False))
+    
+    def is_ephemeral(self, session_id: str) -> bool:
+        """Whether a session lives only in the short-lived ephemeral cache."""
+        return session_id in self._ephemeral_sessions
+    
+    async def _save_new_session(
+        self,
+        session_id: str,
+        session_memory: SessionMemory,
+        ephemeral: bool = False
+    ) -> SessionMemory:
+        """Persist a freshly built session with error recovery.
+        
+        Ephemeral sessions skip persistence and only go into the short-lived cache.
+        """
+        if ephemeral:
+            self._ephemeral_sessions[session_id] = session_memory
+            return session_memory
         
         async def _create_session_operation():
-            # Parse settings
-            session_settings = SessionSettings(
-                sessionType=SessionTypeConfig(**settings_data.get("sessionType", {"type": "MANUAL"})),
-                strictness=settings_data.get("strictness", 0.5),
-                notify=NotificationSettings(**settings_data.get("notify", {"details": True, "links": True}))
-            )
-            
-            # Create session memory
-            session_memory = SessionMemory(
-                settings=session_settings,
-                timeline=[],
-                currentActivity=None,
-                pastContents={},
-                lastClaimsChecked=[]
-            )
-            
             # Store session
             await self._store_session(session_id, session_memory)
             
@@ -71,36 +211,55 @@ class SessionManager:
         )
         
         if isinstance(result, EnhancedErrorResponse):
-            # If all retries failed, still attempt to create session in memory
-            session_settings = SessionSettings(
-                sessionType=SessionTypeConfig(**settings_data.get("sessionType", {"type": "MANUAL"})),
-                strictness=settings_data.get("strictness", 0.5),
-                notify=NotificationSettings(**settings_data.get("notify", {"details": True, "links": True}))
-            )
-            
-            session_memory = SessionMemory(
-                settings=session_settings,
-                timeline=[],
-                currentActivity=None,
-                pastContents={},
-                lastClaimsChecked=[]
-            )
-            
-            # Store in memory as fallback
-            self.sessions[session_id] = session_memory
+            # If all retries failed, still keep the session in memory as fallback
+            self._store_in_memory(session_id, session_memory)
             return session_memory
         
         return result
     
+    def _build_session_memory(self, settings_data: Dict[str, any]) -> SessionMemory:
+        """Build an empty session memory from client-provided settings."""
+        return self._empty_session_memory(self._parse_settings(settings_data))
+    
+    @staticmethod
+    def _parse_settings(settings_data: Dict[str, any]) -> SessionSettings:
+        """Parse client-provided settings (client input, fully validated)."""
+        return SessionSettings(
+            sessionType=SessionTypeConfig(**settings_data.get("sessionType", {"type": "MANUAL"})),
+            strictness=settings_data.get("strictness", 0.5),
+            notify=NotificationSettings(**settings_data.get("notify", {"details": True, "links": True}))
+        )
+    
+    @staticmethod
+    def _empty_session_memory(session_settings: SessionSettings) -> SessionMemory:
+        """Build an empty session memory around already-validated settings."""
+        # Everything else is a known-good empty default, so skip re-validation
+        return SessionMemory.model_construct(
+            settings=session_settings,
+            timeline=[],
+            current_activity=None,
+            past_contents={},
+            last_claims_checked=[]
+        )
+    
     async def get_session(self, session_id: str) -> SessionOperationResult:
         """Retrieve session memory with error recovery."""
         
         async def _get_session_operation():
+            session_memory = self._ephemeral_sessions.get(session_id)
+            if session_memory:
+                return session_memory
             if self.redis:
-                data = await self.redis.get(f"session:{session_id}")
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.get(f"session:{session_id}")
+                pipe.lrange(f"session:{session_id}:timeline", 0, -1)
+                data, events = await pipe.execute()
                 if data:
-                    session_data = json.loads(data)
-                    session_memory = SessionMemory(**session_data)
+                    # Splice the timeline list back into the session document
+                    session_memory = SessionMemory.model_validate_json(
+                        b'{"timeline":[' + b",".join(events) + b"]," + data[1:]
+                    )
+                    self._timeline_len[session_id] = len(events)
                     return session_memory
                 else:
                     # Try fallback to in-memory
@@ -148,10 +307,25 @@ class SessionManager:
                 )
             )
     
-    async def update_session(self, session_id: str, session_memory: SessionMemory) -> SessionOperationResult:
-        """Update session memory with proper error handling."""
+    async def update_session(
+        self,
+        session_id: str,
+        session_memory: SessionMemory,
+        include_timeline: bool = True
+    ) -> SessionOperationResult:
+        """Update session memory with proper error handling.
+        
+        With ``include_timeline=False`` only the session document is written and
+        the stored timeline is left as is; new events then go through
+        ``append_timeline_event``.
+        """
+        if session_id in self._ephemeral_sessions:
+            if not include_timeline:
+                session_memory = self._keep_timeline(self._ephemeral_sessions[session_id], session_memory)
+            self._ephemeral_sessions[session_id] = session_memory
+            return SessionOperationResult.success_result()
         try:
-            await self._store_session(session_id, session_memory)
+            await self._store_session(session_id, session_memory, include_timeline)
             return SessionOperationResult.success_result()
         except Exception as e:
             return SessionOperationResult.error_result(
@@ -163,39 +337,231 @@ class SessionManager:
                 )
             )
     
-    async def _store_session(self, session_id: str, session_memory: SessionMemory):
-        """Store session memory in Redis or in-memory."""
+    async def append_timeline_event(self, session_id: str, event: TimelineEvent) -> SessionOperationResult:
+        """Append a single timeline event without rewriting the whole session."""
+        ephemeral_memory = self._ephemeral_sessions.get(session_id)
+        if ephemeral_memory:
+            ephemeral_memory.timeline.append(event)
+            return SessionOperationResult.success_result()
         if self.redis:
             try:
-                data = session_memory.model_dump_json(by_alias=True)
-                await self.redis.setex(
-                    f"session:{session_id}",
-                    timedelta(hours=settings.session_ttl_hours),
-                    data
+                key = f"session:{session_id}:timeline"
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.rpush(key, self._encode_timeline_event(event))
+                pipe.expire(key, timedelta(hours=settings.session_ttl_hours))
+                length, _ = await pipe.execute()
+                if session_id in self._timeline_len:
+                    self._timeline_len[session_id] = length
+                return SessionOperationResult.success_result()
+            except Exception as e:
+                print(f"Redis timeline append error: {e}")
+        
+        session_memory = self.sessions.get(session_id)
+        if session_memory is None:
+            return SessionOperationResult.error_result(
+                ErrorResponse(
+                    error_type=ErrorType.SESSION_NOT_FOUND,
+                    severity=ErrorSeverity.MEDIUM,
+                    message=f"Session {session_id} not found"
                 )
-                return
+            )
+        session_memory.timeline.append(event)
+        self._store_in_memory(session_id, session_memory)
+        return SessionOperationResult.success_result()
+    
+    @staticmethod
+    def _keep_timeline(stored: Optional[SessionMemory], session_memory: SessionMemory) -> SessionMemory:
+        """Return session_memory carrying the stored session's timeline instead of its own."""
+        return session_memory.model_copy(update={"timeline": stored.timeline if stored else []})
+    
+    async def _store_session(
+        self,
+        session_id: str,
+        session_memory: SessionMemory,
+        include_timeline: bool = True
+    ):
+        """Store session memory in Redis or in-memory, waiting for the write to land."""
+        data = None
+        if self.redis and self._write_queue is not None and self._is_large_session(session_memory):
+            # Large sessions are serialized off the event loop
+            try:
+                data = await asyncio.to_thread(self._serialize_session, session_memory)
+            except Exception as e:
+                print(f"Redis store error: {e}")
+        
+        await self._enqueue_write(session_id, session_memory, data, include_timeline)
+    
+    def _is_large_session(self, session_memory: SessionMemory) -> bool:
+        """Whether serializing this session is expensive enough to offload."""
+        size = len(session_memory.timeline) + len(session_memory.past_contents)
+        return size > self._offload_serialization_threshold
+    
+    @staticmethod
+    def _serialize_session(session_memory: SessionMemory) -> bytes:
+        """Serialize session memory, minus the timeline, to the JSON bytes stored in Redis."""
+        return orjson.dumps(session_memory.model_dump(by_alias=True, mode="json", exclude={"timeline"}))
+    
+    @staticmethod
+    def _encode_timeline_event(event: TimelineEvent) -> bytes:
+        """Serialize one timeline event for the session's Redis list."""
+        return orjson.dumps(event.model_dump(by_alias=True, mode="json"))
+    
+    def _timeline_delta(self, session_id: str, session_memory: SessionMemory):
+        """Return (replace, encoded_events) needed to bring Redis up to date.
+        
+        Only events past the known persisted length are encoded; if that length
+        is unknown or the timeline shrank, the whole list is rewritten.
+        """
+        timeline = session_memory.timeline
+        persisted = self._timeline_len.get(session_id)
+        replace = persisted is None or persisted > len(timeline)
+        new_events = timeline if replace else timeline[persisted:]
+        self._timeline_len[session_id] = len(timeline)
+        return replace, [self._encode_timeline_event(event) for event in new_events]
+    
+    def _enqueue_write(
+        self,
+        session_id: str,
+        session_memory: SessionMemory,
+        data: Optional[bytes] = None,
+        include_timeline: bool = True
+    ) -> asyncio.Future:
+        """Queue a session write for the next pipeline flush.
+        
+        Returns a future resolved once the write has been flushed; callers that
+        don't need confirmation can drop it (fire-and-forget). Without
+        ``include_timeline`` the stored timeline is left untouched.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        if self.redis and self._write_queue is not None:
+            try:
+                if data is None:
+                    data = self._serialize_session(session_memory)
+                if include_timeline:
+                    replace, events = self._timeline_delta(session_id, session_memory)
+                else:
+                    replace, events = False, []
+                self._write_queue.put_nowait((session_id, data, replace, events, session_memory, future))
+                return future
             except Exception as e:
                 print(f"Redis store error: {e}")
         
         # Fallback to in-memory
+        if not include_timeline:
+            session_memory = self._keep_timeline(self.sessions.get(session_id), session_memory)
+        self._store_in_memory(session_id, session_memory)
+        future.set_result(None)
+        return future
+    
+    def _store_in_memory(self, session_id: str, session_memory: SessionMemory):
+        """Keep a session in the in-memory fallback and index its expiry."""
         self.sessions[session_id] = session_memory
+        started_at = self._started_at.setdefault(session_id, datetime.utcnow())
+        expiry = self._predict_expiry(session_memory, started_at)
+        
+        if expiry is not None and self._expiry_at.get(session_id) != expiry:
+            self._expiry_at[session_id] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, session_id))
+    
+    @staticmethod
+    def _predict_expiry(memory: SessionMemory, started_at: datetime) -> Optional[datetime]:
+        """Return when a TIME session runs out, or None if it has no time limit."""
+        session_type = memory.settings.session_type
+        if session_type.type != SessionType.TIME or not session_type.minutes:
+            return None
+        return started_at + timedelta(minutes=session_type.minutes)
+    
+    async def _flush_loop(self):
+        """Background task draining the write queue into Redis pipelines."""
+        while True:
+            batch = []
+            try:
+                batch.append(await self._write_queue.get())
+                
+                # Give concurrent writers a moment to join this batch
+                await asyncio.sleep(self._write_flush_interval)
+                while len(batch) < self._write_batch_size and not self._write_queue.empty():
+                    batch.append(self._write_queue.get_nowait())
+                
+                await self._flush_writes(batch)
+            except asyncio.CancelledError:
+                if batch:
+                    await self._flush_writes(batch)
+                break
+            except Exception as e:
+                print(f"Session write loop error: {e}")
+    
+    async def _flush_writes(self, batch: list):
+        """Write a batch of sessions to Redis in one pipeline."""
+        ttl = timedelta(hours=settings.session_ttl_hours)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for session_id, data, replace, events, _, _ in batch:
+                pipe.setex(f"session:{session_id}", ttl, data)
+                timeline_key = f"session:{session_id}:timeline"
+                if replace:
+                    pipe.delete(timeline_key)
+                if events:
+                    pipe.rpush(timeline_key, *events)
+                pipe.expire(timeline_key, ttl)
+            await pipe.execute()
+        except Exception as e:
+            print(f"Redis store error: {e}")
+            # Fallback to in-memory
+            for session_id, _, _, _, session_memory, _ in batch:
+                # Redis state is unknown now, so the next write rewrites the timeline
+                self._timeline_len.pop(session_id, None)
+                self._store_in_memory(session_id, session_memory)
+        
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
     
     async def delete_session(self, session_id: str):
         """Delete a session."""
         if self.redis:
             try:
-                await self.redis.delete(f"session:{session_id}")
+                await self.redis.delete(f"session:{session_id}", f"session:{session_id}:timeline")
             except:
                 pass
         
         self.sessions.pop(session_id, None)
+        self._ephemeral_sessions.pop(session_id, None)
+        self._expiry_at.pop(session_id, None)
+        self._started_at.pop(session_id, None)
+        self._timeline_len.pop(session_id, None)
+    
+    async def delete_sessions(self, session_ids: List[str]):
+        """Delete several sessions with a single Redis round-trip."""
+        if self.redis and session_ids:
+            try:
+                keys = []
+                for session_id in session_ids:
+                    keys.extend((f"session:{session_id}", f"session:{session_id}:timeline"))
+                await self.redis.delete(*keys)
+            except:
+                pass
+        
+        for session_id in session_ids:
+            self.sessions.pop(session_id, None)
+            self._ephemeral_sessions.pop(session_id, None)
+            self._expiry_at.pop(session_id, None)
+            self._started_at.pop(session_id, None)
+            self._timeline_len.pop(session_id, None)
     
     async def list_active_sessions(self) -> List[str]:
         """List all active session IDs."""
         if self.redis:
             try:
-                keys = await self.redis.keys("session:*")
-                return [key.decode().replace("session:", "") for key in keys]
+                prefix_len = len("session:")
+                session_ids = []
+                async for key in self.redis.scan_iter(match="session:*", count=1000):
+                    if key.endswith(b":timeline"):
+                        continue
+                    session_ids.append(key.decode()[prefix_len:])
+                return session_ids
             except:
                 pass
         
@@ -203,34 +569,21 @@ class SessionManager:
     
     async def cleanup_expired_sessions(self):
         """Clean up expired sessions (for in-memory storage)."""
-        # Redis handles TTL automatically, this is for in-memory cleanup
+        # Redis handles TTL automatically and the in-memory cache evicts inactive
+        # sessions on its own, so only the session type policies are checked here
+        self.sessions.expire()
         current_time = datetime.utcnow()
         expired_sessions = []
         
-        for session_id, memory in self.sessions.items():
-            try:
-                # Check if session should expire based on settings
-                if memory.settings.sessionType.type == SessionType.TIME:
-                    if memory.settings.sessionType.minutes:
-                        # Calculate session duration from timeline
-                        if memory.timeline:
-                            first_event_time = memory.timeline[0].get("timestamp")
-                            if first_event_time:
-                                # Parse timestamp and check if expired
-                                session_duration = (current_time - first_event_time).total_seconds() / 60
-                                if session_duration > memory.settings.sessionType.minutes:
-                                    expired_sessions.append(session_id)
-                
-                # Check for inactive sessions (no activity for 24 hours)
-                if memory.timeline:
-                    last_activity = memory.timeline[-1].get("timestamp", current_time)
-                    inactive_hours = (current_time - last_activity).total_seconds() / 3600
-                    if inactive_hours > 24:  # 24 hours of inactivity
-                        expired_sessions.append(session_id)
-                        
-            except Exception as e:
-                print(f"Error checking session expiry for {session_id}: {e}")
-                # Add problematic sessions to expired list
+        # Only sessions whose scheduled expiry has passed are looked at; the
+        # schedule is exact, so a current entry that is due has expired
+        while self._expiry_heap and self._expiry_heap[0][0] <= current_time:
+            expiry, session_id = heapq.heappop(self._expiry_heap)
+            if self._expiry_at.get(session_id) != expiry:
+                continue  # Rescheduled or deleted since this entry was pushed
+            del self._expiry_at[session_id]
+            
+            if session_id in self.sessions:
                 expired_sessions.append(session_id)
         
         # Clean up expired sessions
@@ -240,46 +593,45 @@ class SessionManager:
 
     def should_end_session(self, session_memory: SessionMemory, frame_bundle: FrameBundle) -> bool:
         """Determine if session should end based on settings and activity."""
-        settings = session_memory.settings
+        # Bind model attributes to locals once; this runs for every frame bundle
+        session_type = session_memory.settings.sessionType
+        stype = session_type.type
+        timeline = session_memory.timeline
         
-        if settings.sessionType.type == SessionType.MANUAL:
+        if stype == SessionType.MANUAL:
             return False  # Only end manually
         
-        if settings.sessionType.type == SessionType.TIME:
+        if stype == SessionType.TIME:
             # Check if time limit exceeded
-            if settings.sessionType.minutes and session_memory.timeline:
+            minutes = session_type.minutes
+            if minutes and timeline:
                 try:
                     # Get first timeline entry timestamp
-                    first_event = session_memory.timeline[0]
-                    start_time = first_event.get("timestamp")
+                    start_time = timeline[0].get("timestamp")
                     
                     if start_time:
                         current_time = frame_bundle.timestamp
                         # Calculate session duration in minutes
                         duration_minutes = (current_time - start_time).total_seconds() / 60
                         
-                        if duration_minutes >= settings.sessionType.minutes:
-                            print(f"Session time limit reached: {duration_minutes:.1f}/{settings.sessionType.minutes} minutes")
+                        if duration_minutes >= minutes:
+                            print(f"Session time limit reached: {duration_minutes:.1f}/{minutes} minutes")
                             return True
                             
                 except Exception as e:
                     print(f"Error checking time limit: {e}")
         
-        if settings.sessionType.type == SessionType.ACTIVITY:
+        if stype == SessionType.ACTIVITY:
             # Activity-based ending logic
-            if session_memory.currentActivity and session_memory.timeline:
+            current_activity = session_memory.currentActivity
+            if current_activity and timeline:
                 try:
                     current_time = frame_bundle.timestamp
                     
                     # Check for stable new activity ≥90s and no new fact-checkable content in last 60s
-                    recent_timeline = [
-                        event for event in session_memory.timeline[-10:]  # Last 10 events
-                        if (current_time - event.get("timestamp", current_time)).total_seconds() <= 90
-                    ]
-                    
                     # Check if current activity is stable (same for ≥90 seconds)
                     current_app = frame_bundle.treeSummary.appPackage
-                    if session_memory.currentActivity.get("app") != current_app:
+                    if current_activity.get("app") != current_app:
                         # Activity changed, update current activity
                         session_memory.currentActivity = {
                             "app": current_app,
@@ -289,17 +641,21 @@ class SessionManager:
                         return False
                     
                     # Check if current activity has been stable for ≥90 seconds
-                    activity_start = session_memory.currentActivity.get("start_time")
+                    activity_start = current_activity.get("start_time")
                     if activity_start:
                         activity_duration = (current_time - activity_start).total_seconds()
                         
                         if activity_duration >= 90:
-                            # Check if there's been fact-checkable content in last 60 seconds
-                            has_recent_content = any(
-                                event.get("has_fact_checkable_content", False)
-                                for event in recent_timeline
-                                if (current_time - event.get("timestamp", current_time)).total_seconds() <= 60
-                            )
+                            # Check if there's been fact-checkable content in last 60 seconds,
+                            # walking back from the newest of the last 10 events
+                            has_recent_content = False
+                            for event in islice(reversed(timeline), 10):
+                                age = (current_time - event.get("timestamp", current_time)).total_seconds()
+                                if age > 90:
+                                    break
+                                if age <= 60 and event.get("has_fact_checkable_content", False):
+                                    has_recent_content = True
+                                    break
                             
                             if not has_recent_content:
                                 print(f"Activity-based session end: stable activity for {activity_duration:.1f}s, no fact-checkable content in 60s")
@@ -318,7 +674,10 @@ class WebSocketConnection:
         self.websocket = websocket
         self.session_id = session_id
         self.connected_at = datetime.utcnow()
-        self.last_heartbeat = datetime.utcnow()
+        # Heartbeats are tracked on the monotonic clock; wall-clock time is only
+        # derived when reported
+        self._connected_monotonic = time.monotonic()
+        self.last_heartbeat = self._connected_monotonic
         self.is_alive = True
         
     async def send_json(self, message: Dict[str, any]):
@@ -331,13 +690,28 @@ class WebSocketConnection:
             self.is_alive = False
             return False
     
+    async def send_raw(self, payload: bytes):
+        """Send an already serialized JSON payload as a text frame."""
+        try:
+            await self.websocket.send_text(payload.decode())
+            return True
+        except Exception as e:
+            print(f"Failed to send message to {self.session_id}: {e}")
+            self.is_alive = False
+            return False
+    
     def update_heartbeat(self):
         """Update last heartbeat timestamp."""
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat = time.monotonic()
+    
+    @property
+    def last_heartbeat_at(self) -> datetime:
+        """Wall-clock time of the last heartbeat."""
+        return self.connected_at + timedelta(seconds=self.last_heartbeat - self._connected_monotonic)
     
     def is_stale(self, timeout_seconds: int = 30) -> bool:
         """Check if connection is stale (no heartbeat for timeout period)."""
-        return (datetime.utcnow() - self.last_heartbeat).total_seconds() > timeout_seconds
+        return (time.monotonic() - self.last_heartbeat) > timeout_seconds
 
 
 class WebSocketManager:
@@ -347,7 +721,9 @@ class WebSocketManager:
         self.connections: Dict[str, WebSocketConnection] = {}
         self.heartbeat_interval = 10  # seconds
         self.connection_timeout = 30  # seconds
+        self.send_timeout = 2.0  # seconds a single heartbeat send may take
         self._heartbeat_task = None
+        self._disconnect_tasks = set()
     
     async def start_heartbeat_monitor(self):
         """Start the heartbeat monitoring task."""
@@ -389,13 +765,28 @@ class WebSocketManager:
             print(f"Cleaned up stale connection for session {session_id}")
     
     async def _send_heartbeats(self):
-        """Send heartbeat messages to all connections."""
-        heartbeat_msg = HeartbeatMessage()
+        """Send heartbeat messages to all connections concurrently.
         
-        for session_id, connection in list(self.connections.items()):
-            success = await connection.send_json(heartbeat_msg.model_dump(by_alias=True))
-            if not success:
-                await self.disconnect(session_id)
+        Each send is bounded by send_timeout so a slow socket cannot stall the
+        heartbeat loop; failed connections are disconnected in the background.
+        """
+        payload = _encode_heartbeat()
+        connections = tuple(self.connections.values())
+        
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_raw(payload), timeout=self.send_timeout)
+                for connection in connections
+            ),
+            return_exceptions=True
+        )
+        
+        for connection, result in zip(connections, results):
+            if result is not True:
+                connection.is_alive = False
+                task = asyncio.get_running_loop().create_task(self.disconnect(connection.session_id, connection))
+                self._disconnect_tasks.add(task)
+                task.add_done_callback(self._disconnect_tasks.discard)
     
     async def connect(self, session_id: str, websocket):
         """Register a WebSocket connection for a session."""
@@ -408,9 +799,14 @@ class WebSocketManager:
         
         print(f"WebSocket connected for session {session_id}")
     
-    async def disconnect(self, session_id: str):
-        """Remove WebSocket connection."""
-        if session_id in self.connections:
+    async def disconnect(self, session_id: str, connection: Optional[WebSocketConnection] = None):
+        """Remove WebSocket connection.
+        
+        When ``connection`` is given, it is only removed if it is still the one
+        registered, so a stale failure cannot drop a client that reconnected.
+        """
+        current = self.connections.get(session_id)
+        if current is not None and (connection is None or current is connection):
             del self.connections[session_id]
             print(f"WebSocket disconnected for session {session_id}")
         
@@ -423,13 +819,23 @@ class WebSocketManager:
         if session_id in self.connections:
             self.connections[session_id].update_heartbeat()
     
-    async def send_to_session(self, session_id: str, message: Dict[str, any]):
-        """Send message to a specific session."""
+    async def send_to_session(self, session_id: str, message: Union[bytes, BaseModel, Dict[str, any]]):
+        """Send message to a specific session.
+        
+        Accepts pre-serialized JSON bytes, a pydantic model or a plain dict; the
+        message is serialized exactly once with orjson.
+        """
         if session_id in self.connections:
             connection = self.connections[session_id]
-            success = await connection.send_json(message)
+            if isinstance(message, (bytes, bytearray)):
+                payload = bytes(message)
+            elif isinstance(message, BaseModel):
+                payload = orjson.dumps(message.model_dump(by_alias=True, mode="json"))
+            else:
+                payload = orjson.dumps(message)
+            success = await connection.send_raw(payload)
             if not success:
-                await self.disconnect(session_id)
+                await self.disconnect(session_id, connection)
             return success
         return False
     
@@ -1,16 +1,32 @@
 """Tool functions for LLM agents to interact with external APIs and services."""
 
 import asyncio
-import json
+import hashlib
+import random
 import re
-from typing import List, Dict, Any, Optional
+import time
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
+import orjson
+
 try:
     import aiohttp
 except ImportError:
     aiohttp = None
 
+from cachetools import LRUCache, TTLCache
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 try:
     import boto3
 except ImportError:
@@ -21,8 +37,67 @@ try:
 except ImportError:
     build = None
 
-from app.core.config import settings
+from app.core.config import settings, SOURCE_TIERS
 from app.models.schemas import WebSearchResult, ReverseImageSearchResult, YouTubeMetadata
+from app.services.http_client import get_session
+
+
+# Per-call timeouts: fail connects fast so breakers trip promptly, but give
+# slow-streaming providers room to finish reading
+if aiohttp:
+    _VALIDATE_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3, sock_read=5)
+    _SEARCH_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_read=10)
+    _IMAGE_SEARCH_TIMEOUT = aiohttp.ClientTimeout(total=25, connect=3, sock_read=20)
+    _FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_read=10)
+else:
+    _VALIDATE_TIMEOUT = _SEARCH_TIMEOUT = _IMAGE_SEARCH_TIMEOUT = _FETCH_TIMEOUT = None
+
+# Fallback HTML stripping for URLFetchTool when selectolax is unavailable
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Video URL extraction patterns, compiled once. url_or_guess is untrusted, so
+# prefer RE2's linear-time matching when google-re2 is installed.
+_url_re = re2 or re
+
+# One alternation covering watch (incl. m.youtube.com), embed, shorts,
+# youtu.be and any other youtube.com URL carrying a v= query parameter
+_YT_ID_RE = _url_re.compile(
+    r'(?:youtube\.com/(?:watch\?v=|embed/|shorts/|.*?[?&]v=)|youtu\.be/)([a-zA-Z0-9_-]{11})'
+)
+_YT_DIRECT_ID = _url_re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
+# Official news channels treated as tier A YouTube sources
+_TIER_A_CHANNEL_RE = re.compile('|'.join(re.escape(keyword) for keyword in (
+    'bbc', 'cnn', 'reuters', 'ap news', 'npr', 'pbs', 'abc news', 'cbs news',
+    'nbc news', 'fox news', 'sky news', 'the guardian', 'new york times'
+)))
+
+# Generic fact-checking sections on news sites
+_FACT_CHECK_PATH_RE = re.compile(r'fact-check|factcheck|reality-check')
+
+# Claim-status indicators with the verdict and weight each contributes
+_CLAIM_STATUS_INDICATORS = {
+    **dict.fromkeys(('false', 'debunked', 'misleading', 'incorrect', 'wrong', 'fabricated'), ('false', 2.0)),
+    **dict.fromkeys(('true', 'verified', 'confirmed', 'accurate', 'correct'), ('supported', 2.0)),
+    **dict.fromkeys(('partly', 'mixed', 'partially', 'mostly false', 'mostly true', 'needs context'), ('contested', 1.5)),
+    **dict.fromkeys(('unclear', 'unverified', 'no evidence', 'unknown'), ('uncertain', 1.0)),
+}
+# A lookahead at every offset finds nested indicators ('false' inside
+# 'mostly false', 'correct' inside 'incorrect') in one scan, which a plain
+# alternation would consume; RE2 has no lookahead, so this stays on re.
+_CLAIM_STATUS_RE = re.compile('(?=(%s))' % '|'.join(
+    re.escape(indicator) for indicator in sorted(_CLAIM_STATUS_INDICATORS, key=len, reverse=True)
+))
+
+_TT_PATTERNS = tuple(_url_re.compile(pattern) for pattern in (
+    r'tiktok\.com/@([^/]+)/video/(\d+)',
+    r'tiktok\.com/t/([a-zA-Z0-9]+)',  # Short links
+    r'vm\.tiktok\.com/([a-zA-Z0-9]+)',  # Mobile short links
+))
+# Title fallback for scraped TikTok pages when selectolax is unavailable;
+# matched on raw bytes so only the title gets decoded
+_TT_TITLE_RE = re.compile(rb'<title>([^<]+)</title>', re.I)
 
 
 class ToolError(Exception):
@@ -30,6 +105,402 @@ class ToolError(Exception):
     pass
 
 
+class TransientError(ToolError):
+    """Retryable provider failure; ``retry_after`` carries its Retry-After hint in seconds."""
+    
+    def __init__(self, message: str, retry_after: Optional[str] = None):
+        super().__init__(message)
+        try:
+            self.retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            self.retry_after = None  # HTTP-date form; fall back to our own backoff
+
+
+class RateLimitedError(TransientError):
+    """Provider answered 429."""
+    pass
+
+
+class ServerError(ToolError):
+    """Provider answered with a 5xx that is not worth retrying."""
+    pass
+
+
+# Gateway and overload statuses worth another attempt
+_TRANSIENT_STATUSES = frozenset({502, 503, 504})
+
+# Dropped or refused connections are retried too. Timeouts are not: another
+# attempt would stack a second full timeout onto the caller's wait.
+_RETRYABLE_ERRORS = (TransientError, aiohttp.ClientConnectionError) if aiohttp else (TransientError,)
+
+# Errors that mean the provider itself is unhealthy: transport failures,
+# timeouts, 5xx and 429. Anything else (no results, bad query, auth) is an
+# answer, so it does not count towards opening a circuit breaker.
+_BREAKER_FAILURES = _RETRYABLE_ERRORS + (ServerError, asyncio.TimeoutError)
+
+
+async def _retry_with_backoff(
+    fn: Callable[[], Awaitable[Any]],
+    *,
+    max_attempts: int = 3,
+    base: float = 1.0,
+    max_delay: float = 5.0,
+    limiter: Optional["RateLimiter"] = None
+) -> Any:
+    """Retry ``fn`` on transient failures with jittered exponential backoff.
+    
+    Jitter keeps rate-limited callers from waking in lockstep and re-hitting
+    the provider together; a Retry-After hint takes precedence when present.
+    ``max_delay`` caps how long one call sleeps in-request: a Retry-After
+    longer than that fails fast instead, leaving the wait to the limiter.
+    When given, ``limiter`` is told about successes and 429s so it can adapt
+    its rate (and go into token debt) for every caller sharing it.
+    """
+    for attempt in range(max_attempts):
+        try:
+            result = await fn()
+        except asyncio.TimeoutError:
+            raise
+        except _RETRYABLE_ERRORS as e:
+            if limiter is not None and isinstance(e, RateLimitedError):
+                limiter.on_failure(e.retry_after)
+            if attempt == max_attempts - 1:
+                raise
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after is not None:
+                if retry_after > max_delay:
+                    raise
+                delay = retry_after
+            else:
+                delay = min(max_delay, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+            await asyncio.sleep(delay)
+        else:
+            if limiter is not None:
+                limiter.on_success()
+            return result
+
+
+class _ResponseCache:
+    """TTL cache of parsed tool responses with single-flight fetching.
+    
+    Concurrent misses for the same key share one upstream request, and only
+    results accepted by ``should_cache`` are stored, so failures are retried.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: int = 600):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a compact cache key from the request inputs."""
+        raw = "\x1f".join(str(part) for part in parts)
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool] = lambda result: True
+    ) -> Any:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self.hits += 1
+                    return cached
+                self.misses += 1
+                result = await fetch()
+                if should_cache(result):
+                    self._cache[key] = result
+                return result
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker (closed -> open -> half_open).
+    
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    calls fail fast with ToolError for ``recovery_timeout`` seconds; then a
+    single probe is let through, and its outcome closes or re-opens it.
+    Only ``_BREAKER_FAILURES`` count as failures; other errors still reach
+    the caller but show the provider is up.
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self.last_failure_time: Optional[float] = None  # Wall clock, for status reporting
+        self._state = "closed"
+        self._probe_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        if self._state == "open" and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self._state = "half_open"
+        return self._state
+    
+    async def call(self, coro_fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._probe_in_flight):
+            raise ToolError(f"{self.name} circuit open - skipping request")
+        
+        is_probe = state == "half_open"
+        if is_probe:
+            self._probe_in_flight = True
+        try:
+            result = await coro_fn(*args, **kwargs)
+        except _BREAKER_FAILURES:
+            self._record_failure()
+            raise
+        except Exception:
+            self._record_success()
+            raise
+        finally:
+            if is_probe:
+                self._probe_in_flight = False
+        
+        self._record_success()
+        return result
+    
+    def _record_success(self):
+        self.failure_count = 0
+        self._state = "closed"
+    
+    def _record_failure(self):
+        self.failure_count += 1
+        self.last_failure_time = time.time()
+        if self._state == "half_open" or self.failure_count >= self.failure_threshold:
+            self._state = "open"
+            self.opened_at = time.monotonic()
+    
+    def reset(self):
+        """Close the breaker and clear its failure count."""
+        self.failure_count = 0
+        self._state = "closed"
+    
+    def status(self) -> Dict[str, Any]:
+        """Snapshot for the /system/circuit-breakers endpoint; times are epoch seconds."""
+        state = self.state
+        next_attempt_time = None
+        if state == "open":
+            next_attempt_time = time.time() + self.recovery_timeout - (time.monotonic() - self.opened_at)
+        return {
+            "state": state,
+            "failure_count": self.failure_count,
+            "last_failure_time": self.last_failure_time,
+            "next_attempt_time": next_attempt_time,
+            "failure_threshold": self.failure_threshold
+        }
+
+
+class RateLimiter:
+    """Token bucket allowing bursts of MAX_TOKENS requests, refilled at RATE per second.
+    
+    RATE adapts to provider feedback: a 429 halves it (down to ``min_rate``)
+    and empties the bucket, and each success wins back a tenth of the
+    configured rate.
+    """
+    
+    def __init__(self, rate: float, max_tokens: int, min_rate: Optional[float] = None):
+        self.RATE = rate
+        self.MAX_TOKENS = max_tokens
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.tokens = float(max_tokens)
+        self.updated_at = time.monotonic()
+    
+    def on_success(self):
+        self.RATE = min(self.max_rate, self.RATE + self.max_rate / 10)
+    
+    def on_failure(self, retry_after: Optional[float] = None):
+        self._add_new_tokens()
+        self.RATE = max(self.min_rate, self.RATE / 2)
+        # Going into debt holds every caller back until Retry-After has passed
+        self.tokens = -min(retry_after, 60.0) * self.RATE if retry_after else 0.0
+    
+    def _add_new_tokens(self):
+        now = time.monotonic()
+        self.tokens = min(self.MAX_TOKENS, self.tokens + (now - self.updated_at) * self.RATE)
+        self.updated_at = now
+    
+    async def wait_for_token(self, cost: float = 1):
+        """Take ``cost`` tokens, sleeping only as long as the refill needs."""
+        cost = min(cost, self.MAX_TOKENS)
+        while True:
+            self._add_new_tokens()
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return
+            await asyncio.sleep((cost - self.tokens) / self.RATE)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD cap on requests in flight to one provider.
+    
+    The cap grows by ``increase`` after each success within ``target_latency``
+    and halves when the provider pushes back (429/5xx or a timeout), so callers
+    back off under load instead of piling more requests onto it.
+    """
+    
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        target_latency: float = 2.0,
+        increase: float = 0.5,
+        decrease: float = 0.5
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+    
+    async def call(self, coro_fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        
+        start = time.monotonic()
+        try:
+            result = await coro_fn(*args, **kwargs)
+        except (TransientError, asyncio.TimeoutError):
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+            raise
+        else:
+            if time.monotonic() - start <= self.target_latency:
+                self.limit = min(self.max_limit, self.limit + self.increase)
+            return result
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+
+# Module-level so every tool instance shares one view of each provider's health
+_serpapi_breaker = CircuitBreaker("SerpAPI")
+_bing_breaker = CircuitBreaker("Bing")
+_google_cse_breaker = CircuitBreaker("Google Custom Search")
+_youtube_breaker = CircuitBreaker("YouTube Data API")
+
+_serpapi_limiter = RateLimiter(rate=10.0, max_tokens=10)
+_bing_limiter = RateLimiter(rate=10.0, max_tokens=10)
+_google_limiter = RateLimiter(rate=1.0, max_tokens=5)
+_youtube_limiter = RateLimiter(rate=2.0, max_tokens=5)
+_tiktok_limiter = RateLimiter(rate=0.5, max_tokens=2)  # TikTok is more restrictive
+_fact_check_limiter = RateLimiter(rate=1.0, max_tokens=3)
+
+_serpapi_concurrency = AdaptiveConcurrencyLimiter()
+_bing_concurrency = AdaptiveConcurrencyLimiter()
+
+
+async def _execute_google_request(request, lock: asyncio.Lock) -> Any:
+    """Run a googleapiclient request in a worker thread.
+    
+    The client's httplib2 transport is not thread-safe, so requests made
+    through one service object are serialized by ``lock``. HttpErrors for
+    429 and 5xx are re-raised as the matching ToolError subclasses so circuit
+    breakers see them as provider failures.
+    """
+    async with lock:
+        try:
+            return await asyncio.to_thread(request.execute)
+        except Exception as e:
+            status = getattr(getattr(e, "resp", None), "status", None)
+            if status == 429:
+                raise RateLimitedError(f"Google API rate limited: {e}") from e
+            if isinstance(status, int) and status >= 500:
+                raise ServerError(f"Google API returned status {status}: {e}") from e
+            raise
+
+
+def _compile_tier_patterns(tiers: Dict[str, List[str]]) -> List[Tuple[str, "re.Pattern"]]:
+    """Compile each tier's indicators into one alternation, kept in priority order."""
+    return [
+        (tier, re.compile("|".join(re.escape(indicator) for indicator in indicators)))
+        for tier, indicators in tiers.items()
+        if indicators
+    ]
+
+
+def _url_host(url: str) -> str:
+    """Return the lowercased hostname of a URL, or an empty string."""
+    try:
+        return urlparse(url).hostname or ""
+    except ValueError:
+        return ""
+
+
+def _match_tier(host: str, patterns: List[Tuple[str, "re.Pattern"]], default: str = "B") -> str:
+    for tier, pattern in patterns:
+        if pattern.search(host):
+            return tier
+    return default
+
+
+def _batch_classify_tiers(
+    urls: List[str], patterns: List[Tuple[str, "re.Pattern"]], default: str = "B"
+) -> List[str]:
+    """Classify a batch of URLs, parsing each hostname once."""
+    return [_match_tier(_url_host(url), patterns, default) for url in urls]
+
+
+_WEB_TIER_PATTERNS = _compile_tier_patterns(SOURCE_TIERS)
+
+_IMAGE_TIER_PATTERNS = _compile_tier_patterns({
+    # Professional photo agencies and news sources
+    "A": [
+        'getty', 'shutterstock', 'ap.org', 'reuters', 'afp.com',
+        'bbc.com', 'cnn.com', 'nytimes.com', 'washingtonpost.com',
+        'theguardian.com', 'npr.org', 'pbs.org'
+    ],
+    # Established media and platforms
+    "B": [
+        'wikipedia.org', 'wikimedia.org', 'britannica.com',
+        'nationalgeographic.com', 'smithsonianmag.com',
+        'time.com', 'newsweek.com', 'economist.com'
+    ],
+    # Social media and user-generated content
+    "C": [
+        'twitter.com', 'facebook.com', 'instagram.com', 'tiktok.com',
+        'reddit.com', 'pinterest.com', 'flickr.com', 'tumblr.com'
+    ],
+})
+
+
+# Shared across tool instances so FactCheckTool's searches hit the same cache
+_search_cache = _ResponseCache(maxsize=1024, ttl=600)
+_reverse_image_cache = _ResponseCache(maxsize=1024, ttl=600)
+_youtube_metadata_cache = _ResponseCache(maxsize=10_000, ttl=86400)
+_url_fetch_cache = _ResponseCache(maxsize=256, ttl=600)
+
+# Placeholder URL of mock search results, which must never be cached
+_MOCK_SEARCH_URL = "https://example.com/search-not-available"
+
+
+def _is_real_search(results: List["WebSearchResult"]) -> bool:
+    """Whether search results came from a provider rather than the mock fallback."""
+    return bool(results) and all(result.url != _MOCK_SEARCH_URL for result in results)
+
+
 class WebSearchTool:
     """Web search functionality using multiple search providers (SerpAPI preferred, Bing fallback)."""
 
@@ -50,9 +521,8 @@ class WebSearchTool:
         # is_configured stays true if any provider is available
         self.is_configured = bool(self.serpapi_key or (getattr(settings, "bing_search_api_key", None)))
 
-        # Rate limiting controls (shared across providers)
-        self.rate_limit_delay = 1.0  # seconds between requests
-        self.last_request_time = 0
+        # Rate limiting follows the preferred provider's token bucket
+        self._limiter = _serpapi_limiter if self.serpapi_key else _bing_limiter
 
     async def validate_api_key(self) -> bool:
         """Validate configured provider key by making a tiny test request.
@@ -73,22 +543,22 @@ class WebSearchTool:
                     "api_key": self.serpapi_key,
                     "num": 1,
                 }
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.serpapi_endpoint, params=params, timeout=5) as resp:
-                        # SerpAPI typically returns 200 even for errors; check payload
-                        if resp.status not in (200, 429):
-                            return False
-                        data = await self._safe_json(resp)
-                        # Success path: search_metadata.status == "Success" and no "error"
-                        status_ok = (
-                            isinstance(data, dict)
-                            and data.get("search_metadata", {}).get("status") == "Success"
-                            and "error" not in data
-                        )
-                        rate_limited = resp.status == 429 or (
-                            isinstance(data, dict) and "error" in data and "Rate limit" in str(data["error"])
-                        )
-                        return bool(status_ok or rate_limited)
+                session = await get_session()
+                async with session.get(self.serpapi_endpoint, params=params, timeout=_VALIDATE_TIMEOUT) as resp:
+                    # SerpAPI typically returns 200 even for errors; check payload
+                    if resp.status not in (200, 429):
+                        return False
+                    data = await self._safe_json(resp)
+                    # Success path: search_metadata.status == "Success" and no "error"
+                    status_ok = (
+                        isinstance(data, dict)
+                        and data.get("search_metadata", {}).get("status") == "Success"
+                        and "error" not in data
+                    )
+                    rate_limited = resp.status == 429 or (
+                        isinstance(data, dict) and "error" in data and "Rate limit" in str(data["error"])
+                    )
+                    return bool(status_ok or rate_limited)
             except Exception:
                 return False
 
@@ -96,11 +566,11 @@ class WebSearchTool:
         if getattr(settings, "bing_search_api_key", None):
             try:
                 params = {"q": "test", "count": 1}
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        self.bing_endpoint, headers=self.bing_headers, params=params, timeout=5
-                    ) as response:
-                        return response.status in (200, 429)
+                session = await get_session()
+                async with session.get(
+                    self.bing_endpoint, headers=self.bing_headers, params=params, timeout=_VALIDATE_TIMEOUT
+                ) as response:
+                    return response.status in (200, 429)
             except Exception:
                 return False
 
@@ -108,16 +578,14 @@ class WebSearchTool:
 
     async def _apply_rate_limiting(self):
         """Apply rate limiting between requests."""
-        import time
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        await self._limiter.wait_for_token()
 
     async def search(self, query: str, max_results: int = 5) -> List["WebSearchResult"]:
         """Perform web search with enhanced error handling.
 
+        Identical queries within the cache TTL are served from memory without
+        touching the providers or the rate limiter.
+
         Args:
             query: Search query string.
             max_results: Desired number of results (capped per provider limits).
@@ -130,40 +598,93 @@ class WebSearchTool:
             return [
                 WebSearchResult(
                     title=f"[MOCK] Search result for: {query}",
-                    url="https://example.com/search-not-available",
+                    url=_MOCK_SEARCH_URL,
                     snippet=f"This is a mock search result for query: {query}. Web search API not configured.",
                     published_date=None,
                 )
             ]
 
+        # Case and spacing don't change what the providers return
+        key = _ResponseCache.make_key("web", " ".join(query.lower().split()), max_results)
+        results = await _search_cache.get_or_fetch(
+            key,
+            lambda: self._search_providers(query, max_results),
+            should_cache=_is_real_search
+        )
+        # Cached results are shared; hand each caller its own copies
+        return [result.model_copy() for result in results]
+
+    async def _search_providers(self, query: str, max_results: int) -> List["WebSearchResult"]:
+        """Run the search against the configured providers, bypassing the cache."""
         await self._apply_rate_limiting()
 
+        # Race both providers when allowed; the first usable answer wins
+        if self.serpapi_key and getattr(settings, "bing_search_api_key", None) and settings.hedged_search:
+            return await self._search_hedged(query=query, max_results=max_results)
+
         # Prefer SerpAPI if available
         if self.serpapi_key:
             try:
-                results = await self._search_serpapi(query=query, max_results=max_results)
+                results = await _serpapi_breaker.call(self._search_serpapi, query=query, max_results=max_results)
                 if results:
                     return results
                 # If SerpAPI returned nothing usable but Bing is configured, try fallback
                 if getattr(settings, "bing_search_api_key", None):
-                    return await self._search_bing(query=query, max_results=max_results)
+                    return await _bing_breaker.call(self._search_bing, query=query, max_results=max_results)
                 # Last-resort mock if nothing returned
                 return self._mock_result(query)
             except Exception as e:
                 # On SerpAPI error, attempt Bing if present
                 if getattr(settings, "bing_search_api_key", None):
                     try:
-                        return await self._search_bing(query=query, max_results=max_results)
+                        return await _bing_breaker.call(self._search_bing, query=query, max_results=max_results)
                     except Exception as be:
                         raise ToolError(f"Web search failed (SerpAPI -> Bing): {e} | {be}")
                 raise ToolError(f"Web search failed (SerpAPI): {e}")
 
         # If only Bing is available
         try:
-            return await self._search_bing(query=query, max_results=max_results)
+            return await _bing_breaker.call(self._search_bing, query=query, max_results=max_results)
         except Exception as e:
             raise ToolError(f"Web search failed (Bing): {e}")
 
+    async def _search_hedged(self, query: str, max_results: int, timeout: float = 8.0) -> List["WebSearchResult"]:
+        """Query SerpAPI and Bing concurrently and return the first non-empty result.
+
+        SerpAPI is preferred when both finish in the same wakeup; the slower
+        request is cancelled as soon as a winner is known.
+        """
+        serpapi_task = asyncio.create_task(_serpapi_breaker.call(self._search_serpapi, query=query, max_results=max_results))
+        bing_task = asyncio.create_task(_bing_breaker.call(self._search_bing, query=query, max_results=max_results))
+        pending = {serpapi_task, bing_task}
+        errors = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, deadline - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    errors.append(f"timed out after {timeout}s")
+                    break
+                for task in (serpapi_task, bing_task):
+                    if task not in done:
+                        continue
+                    if task.exception() is not None:
+                        errors.append(str(task.exception()))
+                    elif task.result():
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if errors:
+            raise ToolError(f"Web search failed (SerpAPI + Bing): {' | '.join(errors)}")
+        return self._mock_result(query)
+
     # ------------------------
     # Internal provider methods
     # ------------------------
@@ -179,16 +700,20 @@ class WebSearchTool:
             # "hl": "en", "gl": "us", "safe": "active"
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.serpapi_endpoint, params=params, timeout=10) as response:
+        async def _attempt():
+            session = await get_session()
+            async with session.get(self.serpapi_endpoint, params=params, timeout=_SEARCH_TIMEOUT) as response:
                 # SerpAPI frequently returns 200; errors live in JSON payload.
                 if response.status == 429:
-                    # Back off briefly and retry once
-                    await asyncio.sleep(2)
-                    async with session.get(self.serpapi_endpoint, params=params, timeout=10) as retry_resp:
-                        return await self._parse_serpapi_response(retry_resp, max_results)
+                    raise RateLimitedError("SerpAPI rate limited: 429", response.headers.get("Retry-After"))
+                if response.status in _TRANSIENT_STATUSES:
+                    raise TransientError(f"SerpAPI unavailable: {response.status}", response.headers.get("Retry-After"))
+                if response.status >= 500:
+                    raise ServerError(f"SerpAPI returned status {response.status}")
                 return await self._parse_serpapi_response(response, max_results)
 
+        return await _retry_with_backoff(lambda: _serpapi_concurrency.call(_attempt), limiter=_serpapi_limiter)
+
     async def _parse_serpapi_response(self, resp, max_results: int) -> List["WebSearchResult"]:
         data = await self._safe_json(resp)
 
@@ -197,6 +722,10 @@ class WebSearchTool:
 
         # Detect SerpAPI error formats
         if "error" in data:
+            # Quoted and site: queries often match nothing; that is an empty
+            # answer, not a provider failure
+            if "hasn't returned any results" in str(data["error"]):
+                return []
             # Common messages: "Rate limit reached", "Invalid API key", etc.
             raise ToolError(f"SerpAPI error: {data['error']} (status={resp.status})")
 
@@ -210,35 +739,37 @@ class WebSearchTool:
         # Optional: also consider "news_results" as fallback if organic empty
         news = data.get("news_results", []) or []
 
-        items = []
-        for item in organic:
-            url = item.get("link", "") or ""
-            result = WebSearchResult(
+        organic = organic[:max_results]
+        # If organic insufficient, top-up with news results (mapped to same schema)
+        news = news[:max_results - len(organic)]
+
+        tiers = _batch_classify_tiers(
+            [item.get("link", "") or "" for item in organic] + [n.get("link", "") or "" for n in news],
+            _WEB_TIER_PATTERNS
+        )
+
+        # Provider fields are plain strings here; skip per-item validation
+        items = [
+            WebSearchResult.model_construct(
                 title=item.get("title", "") or "",
-                url=url,
+                url=item.get("link", "") or "",
                 snippet=item.get("snippet", "") or "",
                 # SerpAPI sometimes has 'date' in organic results, but not guaranteed
                 published_date=item.get("date"),
+                tier=tier,
             )
-            result.tier = self._classify_source_tier(url)
-            items.append(result)
-            if len(items) >= max_results:
-                break
-
-        # If organic insufficient, top-up with news results (mapped to same schema)
-        if len(items) < max_results and news:
-            for n in news:
-                url = n.get("link", "") or ""
-                result = WebSearchResult(
-                    title=n.get("title", "") or "",
-                    url=url,
-                    snippet=n.get("snippet", "") or n.get("source", "") or "",
-                    published_date=n.get("date"),
-                )
-                result.tier = self._classify_source_tier(url)
-                items.append(result)
-                if len(items) >= max_results:
-                    break
+            for item, tier in zip(organic, tiers)
+        ]
+        items.extend(
+            WebSearchResult.model_construct(
+                title=n.get("title", "") or "",
+                url=n.get("link", "") or "",
+                snippet=n.get("snippet", "") or n.get("source", "") or "",
+                published_date=n.get("date"),
+                tier=tier,
+            )
+            for n, tier in zip(news, tiers[len(organic):])
+        )
 
         return items
 
@@ -252,40 +783,39 @@ class WebSearchTool:
             "safeSearch": "Moderate",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.bing_endpoint, headers=self.bing_headers, params=params, timeout=10) as response:
+        async def _attempt():
+            session = await get_session()
+            async with session.get(self.bing_endpoint, headers=self.bing_headers, params=params, timeout=_SEARCH_TIMEOUT) as response:
                 if response.status == 429:
-                    # Rate limited - wait and retry once
-                    await asyncio.sleep(2)
-                    async with session.get(
-                        self.bing_endpoint, headers=self.bing_headers, params=params, timeout=10
-                    ) as retry_response:
-                        if retry_response.status != 200:
-                            raise ToolError(f"Search API rate limited: {retry_response.status}")
-                        return await self._parse_bing_response(retry_response, max_results)
+                    raise RateLimitedError("Search API rate limited: 429", response.headers.get("Retry-After"))
+                elif response.status in _TRANSIENT_STATUSES:
+                    raise TransientError(f"Search API unavailable: {response.status}", response.headers.get("Retry-After"))
+                elif response.status >= 500:
+                    raise ServerError(f"Search API returned status {response.status}")
                 elif response.status != 200:
                     raise ToolError(f"Search API returned status {response.status}")
 
                 return await self._parse_bing_response(response, max_results)
 
+        return await _retry_with_backoff(lambda: _bing_concurrency.call(_attempt), limiter=_bing_limiter)
+
     async def _parse_bing_response(self, resp, max_results: int) -> List["WebSearchResult"]:
         data = await self._safe_json(resp)
         if not isinstance(data, dict):
             raise ToolError(f"Bing: Unexpected response type (status={resp.status})")
 
-        values = data.get("webPages", {}).get("value", []) or []
-        results = []
-        for item in values[:max_results]:
-            url = item.get("url", "") or ""
-            r = WebSearchResult(
+        values = (data.get("webPages", {}).get("value", []) or [])[:max_results]
+        tiers = _batch_classify_tiers([item.get("url", "") or "" for item in values], _WEB_TIER_PATTERNS)
+        return [
+            WebSearchResult.model_construct(
                 title=item.get("name", "") or "",
-                url=url,
+                url=item.get("url", "") or "",
                 snippet=item.get("snippet", "") or "",
                 published_date=item.get("datePublished"),
+                tier=tier,
             )
-            r.tier = self._classify_source_tier(url)
-            results.append(r)
-        return results
+            for item, tier in zip(values, tiers)
+        ]
 
     # ------------------------
     # Helpers
@@ -295,105 +825,152 @@ class WebSearchTool:
         return [
             WebSearchResult(
                 title=f"[MOCK] Search result for: {query}",
-                url="https://example.com/search-not-available",
+                url=_MOCK_SEARCH_URL,
                 snippet=f"This is a mock search result for query: {query}. Web search API not configured.",
                 published_date=None,
             )
         ]
 
     async def _safe_json(self, resp):
-        """Best-effort JSON parsing with graceful fallback."""
+        """Best-effort JSON parsing; returns None when the body is not JSON.
+
+        Parses the raw bytes with orjson, which ignores a mislabelled
+        content-type and skips decoding the body to str first.
+        """
         try:
-            return await resp.json(content_type=None)
+            return orjson.loads(await resp.read())
         except Exception:
-            try:
-                text = await resp.text()
-                # Attempt a late parse if response mislabels content-type
-                import json
-                return json.loads(text)
-            except Exception:
-                return None
+            return None
 
     def _classify_source_tier(self, url: str) -> str:
         """Classify source tier based on URL domain."""
-        from app.core.config import SOURCE_TIERS
-        domain = url.lower()
-
-        for tier_a_domain in SOURCE_TIERS.get("A", []):
-            if tier_a_domain in domain:
-                return "A"
-
-        for tier_b_domain in SOURCE_TIERS.get("B", []):
-            if tier_b_domain in domain:
-                return "B"
-
-        for tier_c_domain in SOURCE_TIERS.get("C", []):
-            if tier_c_domain in domain:
-                return "C"
-
         # Default to tier B for unknown but established domains
-        return "B"
+        return _match_tier(_url_host(url), _WEB_TIER_PATTERNS)
 
 
 
 class URLFetchTool:
     """Tool for fetching content from URLs."""
     
+    # Raw HTML read per requested output char, with a floor so markup-heavy
+    # <head> sections don't starve the body text
+    read_bytes_per_char = 6
+    min_read_bytes = 256 * 1024
+    
     async def fetch_url(self, url: str, max_chars: int = 5000) -> str:
         """Fetch content from a URL and return text content."""
         if not aiohttp:
             return f"URL fetch not available (aiohttp not installed): {url}"
         
+        # Only successful fetches are cached; errors are returned as strings
+        return await _url_fetch_cache.get_or_fetch(
+            _ResponseCache.make_key("fetch", url.strip(), max_chars),
+            lambda: self._fetch(url, max_chars),
+            should_cache=lambda text: not text.startswith("Error:")
+        )
+    
+    async def _fetch(self, url: str, max_chars: int) -> str:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=10) as response:
-                    if response.status != 200:
-                        return f"Error: HTTP {response.status}"
-                    
-                    content = await response.text()
-                    
-                    # Simple text extraction
-                    text = re.sub(r'<[^>]+>', ' ', content)
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    
-                    return text[:max_chars]
+        async def _attempt():
+            session = await get_session()
+            async with session.get(url, headers=headers, timeout=_FETCH_TIMEOUT) as response:
+                if response.status in _TRANSIENT_STATUSES:
+                    raise TransientError(f"HTTP {response.status}", response.headers.get("Retry-After"))
+                if response.status != 200:
+                    return f"Error: HTTP {response.status}"
+                
+                content = await self._read_limited(
+                    response, max(max_chars * self.read_bytes_per_char, self.min_read_bytes)
+                )
+                
+                return self._extract_text(content)[:max_chars]
         
+        try:
+            return await _retry_with_backoff(_attempt, base=0.5)
         except asyncio.TimeoutError:
             return "Error: Request timeout"
         except Exception as e:
             return f"Error: {str(e)}"
+    
+    async def _read_limited(self, response, limit: int) -> str:
+        """Read at most about ``limit`` body bytes and decode them once."""
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(8192):
+            buf.extend(chunk)
+            if len(buf) >= limit:
+                break
+        try:
+            return buf.decode(response.charset or "utf-8", errors="replace")
+        except LookupError:
+            return buf.decode("utf-8", errors="replace")
+    
+    def _extract_text(self, content: str) -> str:
+        """Extract visible text from HTML, dropping script and style content."""
+        if HTMLParser is not None:
+            try:
+                tree = HTMLParser(content)
+                for node in tree.css("script, style, noscript"):
+                    node.decompose()
+                root = tree.body or tree.root
+                return " ".join(root.text(separator=" ").split()) if root else ""
+            except Exception:
+                pass  # Fall back to regex stripping on malformed input
+        
+        # Simple text extraction
+        text = _TAG_RE.sub(' ', content)
+        return _WS_RE.sub(' ', text).strip()
 
 
 class ReverseImageSearchTool:
     """Tool for reverse image search using SERPAPI with Google reverse image search engine."""
     
+    cse_endpoint = "https://www.googleapis.com/customsearch/v1"
+    
     def __init__(self):
         # SERPAPI configuration (primary)
         self.serpapi_key = getattr(settings, "serpapi_api_key", None)
         self.serpapi_endpoint = "https://serpapi.com/search.json"
         
-        # Legacy Google Custom Search (fallback)
+        # Legacy Google Custom Search (fallback); the client is built on first
+        # use, and only when aiohttp is missing
         self.service = None
-        self.google_configured = bool(build and settings.google_custom_search_api_key and settings.google_custom_search_engine_id)
+        self._service_lock = asyncio.Lock()
+        self._build_lock = asyncio.Lock()
+        self.google_configured = bool((aiohttp or build) and settings.google_custom_search_api_key and settings.google_custom_search_engine_id)
         
         # Primary configuration check - SERPAPI preferred
         self.is_configured = bool(self.serpapi_key or self.google_configured)
         
-        # Rate limiting
-        self.rate_limit_delay = 2.0  # More conservative for image search
-        self.last_request_time = 0
+        # Rate limiting follows the preferred provider's token bucket
+        self._limiter = _serpapi_limiter if self.serpapi_key else _google_limiter
+    
+    async def _ensure_service(self):
+        """Build the Custom Search client on first use, off the event loop.
         
-        # Setup legacy Google Custom Search as fallback
-        if self.google_configured:
-            try:
-                self.service = build("customsearch", "v1", developerKey=settings.google_custom_search_api_key)
-            except Exception:
-                self.service = None
-                self.google_configured = False
+        build() fetches the discovery document, so deferring it keeps startup
+        fast and independent of Google availability.
+        """
+        if self.service is None and self.google_configured:
+            async with self._build_lock:
+                if self.service is None and self.google_configured:
+                    try:
+                        self.service = await asyncio.to_thread(
+                            build, "customsearch", "v1", developerKey=settings.google_custom_search_api_key
+                        )
+                    except Exception:
+                        self.service = None
+                        self.google_configured = False
+                        self.is_configured = bool(self.serpapi_key)
+        return self.service
+    
+    async def _google_ready(self) -> bool:
+        """Whether the Custom Search fallback can be used; _cse_list needs the client only without aiohttp."""
+        if not self.google_configured:
+            return False
+        return aiohttp is not None or await self._ensure_service() is not None
     
     async def validate_api_key(self) -> bool:
         """Validate SERPAPI configuration with test reverse image search."""
@@ -410,28 +987,24 @@ class ReverseImageSearchTool:
                     "image_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/4/41/Sunflower_from_Silesia2.jpg/256px-Sunflower_from_Silesia2.jpg",
                     "num": 1
                 }
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.serpapi_endpoint, params=params, timeout=10) as resp:
-                        if resp.status not in (200, 429):
-                            return False
-                        data = await self._safe_json(resp)
-                        # Check for successful SERPAPI response
-                        return (
-                            isinstance(data, dict) and
-                            data.get("search_metadata", {}).get("status") == "Success" and
-                            "error" not in data
-                        ) or resp.status == 429  # Rate limited but key valid
+                session = await get_session()
+                async with session.get(self.serpapi_endpoint, params=params, timeout=_SEARCH_TIMEOUT) as resp:
+                    if resp.status not in (200, 429):
+                        return False
+                    data = await self._safe_json(resp)
+                    # Check for successful SERPAPI response
+                    return (
+                        isinstance(data, dict) and
+                        data.get("search_metadata", {}).get("status") == "Success" and
+                        "error" not in data
+                    ) or resp.status == 429  # Rate limited but key valid
             except Exception:
                 pass
         
         # Fallback to Google Custom Search validation
-        if self.google_configured and self.service:
+        if await self._google_ready():
             try:
-                result = self.service.cse().list(
-                    q="test",
-                    cx=settings.google_custom_search_engine_id,
-                    num=1
-                ).execute()
+                result = await self._cse_list(q="test", num=1)
                 return True
             except Exception:
                 pass
@@ -441,65 +1014,44 @@ class ReverseImageSearchTool:
     async def _safe_json(self, resp):
         """Safe JSON parsing with fallback."""
         try:
-            return await resp.json(content_type=None)
+            return orjson.loads(await resp.read())
         except Exception:
-            try:
-                text = await resp.text()
-                import json
-                return json.loads(text)
-            except Exception:
-                return None
+            return None
+    
+    async def _cse_list(self, **params) -> dict:
+        """Call the Custom Search JSON API, natively when aiohttp is available."""
+        params["cx"] = settings.google_custom_search_engine_id
+        if not aiohttp:
+            return await _execute_google_request(self.service.cse().list(**params), self._service_lock)
+        
+        params["key"] = settings.google_custom_search_api_key
+        
+        async def _attempt():
+            session = await get_session()
+            async with session.get(self.cse_endpoint, params=params, timeout=_IMAGE_SEARCH_TIMEOUT) as resp:
+                if resp.status == 429:
+                    raise RateLimitedError("Google Custom Search rate limited: 429", resp.headers.get("Retry-After"))
+                elif resp.status in _TRANSIENT_STATUSES:
+                    raise TransientError(f"Google Custom Search unavailable: {resp.status}", resp.headers.get("Retry-After"))
+                elif resp.status >= 500:
+                    raise ServerError(f"Google Custom Search returned status {resp.status}")
+                elif resp.status != 200:
+                    raise ToolError(f"Google Custom Search returned status {resp.status}")
+                return orjson.loads(await resp.read())
+        
+        return await _retry_with_backoff(_attempt, limiter=_google_limiter)
     
     async def _apply_rate_limiting(self):
         """Apply rate limiting between requests."""
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+        await self._limiter.wait_for_token()
     
     def _classify_source_tier(self, url: str) -> str:
         """Classify source tier for reverse image search results."""
         if not url:
             return "C"
-            
-        domain = url.lower()
-        
-        # Professional photo agencies and news sources (Tier A)
-        tier_a_indicators = [
-            'getty', 'shutterstock', 'ap.org', 'reuters', 'afp.com',
-            'bbc.com', 'cnn.com', 'nytimes.com', 'washingtonpost.com',
-            'theguardian.com', 'npr.org', 'pbs.org'
-        ]
-        
-        for indicator in tier_a_indicators:
-            if indicator in domain:
-                return "A"
-        
-        # Established media and platforms (Tier B)
-        tier_b_indicators = [
-            'wikipedia.org', 'wikimedia.org', 'britannica.com',
-            'nationalgeographic.com', 'smithsonianmag.com',
-            'time.com', 'newsweek.com', 'economist.com'
-        ]
-        
-        for indicator in tier_b_indicators:
-            if indicator in domain:
-                return "B"
-                
-        # Social media and user-generated content (Tier C)
-        tier_c_indicators = [
-            'twitter.com', 'facebook.com', 'instagram.com', 'tiktok.com',
-            'reddit.com', 'pinterest.com', 'flickr.com', 'tumblr.com'
-        ]
         
-        for indicator in tier_c_indicators:
-            if indicator in domain:
-                return "C"
-                
         # Default to tier B for unknown but established domains
-        return "B"
+        return _match_tier(_url_host(url), _IMAGE_TIER_PATTERNS)
     
     async def _reverse_search_serpapi(self, image_url: str) -> ReverseImageSearchResult:
         """Perform reverse image search using SERPAPI."""
@@ -511,43 +1063,51 @@ class ReverseImageSearchTool:
             "safe": "active"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.serpapi_endpoint, params=params, timeout=20) as resp:
+        async def _attempt():
+            session = await get_session()
+            async with session.get(self.serpapi_endpoint, params=params, timeout=_IMAGE_SEARCH_TIMEOUT) as resp:
                 if resp.status == 429:
-                    # Rate limited - wait and retry once
-                    await asyncio.sleep(5)
-                    async with session.get(self.serpapi_endpoint, params=params, timeout=20) as retry_resp:
-                        if retry_resp.status != 200:
-                            raise ToolError(f"SERPAPI rate limited: {retry_resp.status}")
-                        resp = retry_resp
+                    raise RateLimitedError("SERPAPI rate limited: 429", resp.headers.get("Retry-After"))
+                elif resp.status in _TRANSIENT_STATUSES:
+                    raise TransientError(f"SERPAPI unavailable: {resp.status}", resp.headers.get("Retry-After"))
+                elif resp.status >= 500:
+                    raise ServerError(f"SERPAPI returned status {resp.status}")
                 elif resp.status != 200:
                     raise ToolError(f"SERPAPI returned status {resp.status}")
-                
-                data = await self._safe_json(resp)
-                if not data:
-                    raise ToolError("Invalid SERPAPI response")
-                
-                # Check for SERPAPI errors
-                if "error" in data:
-                    error_msg = data["error"]
-                    # If it's just "no results", return empty result instead of failing
-                    if "hasn't returned any results" in error_msg:
-                        return ReverseImageSearchResult(
-                            similar_images=[],
-                            best_guess="No reverse image search results found for this image",
-                            matching_pages=[]
-                        )
-                    else:
-                        raise ToolError(f"SERPAPI error: {error_msg}")
-                
-                return self._parse_serpapi_response(data)
+                return await self._safe_json(resp)
+        
+        data = await _retry_with_backoff(_attempt, base=2.0, limiter=_serpapi_limiter)
+        if not data:
+            raise ToolError("Invalid SERPAPI response")
+        
+        # Check for SERPAPI errors
+        if "error" in data:
+            error_msg = data["error"]
+            # If it's just "no results", return empty result instead of failing
+            if "hasn't returned any results" in error_msg:
+                return ReverseImageSearchResult(
+                    similar_images=[],
+                    best_guess="No reverse image search results found for this image",
+                    matching_pages=[]
+                )
+            else:
+                raise ToolError(f"SERPAPI error: {error_msg}")
+        
+        return self._parse_serpapi_response(data)
     
     def _parse_serpapi_response(self, data: dict) -> ReverseImageSearchResult:
         """Parse SERPAPI reverse image search response."""
         similar_images = []
+        seen_images = set()
         matching_pages = []
         best_guess = None
         
+        def _add_image(image_url: Optional[str]):
+            # Dedupe while accumulating, keeping only the top 5 similar images
+            if image_url and image_url not in seen_images and len(similar_images) < 5:
+                seen_images.add(image_url)
+                similar_images.append(image_url)
+        
         # Extract best guess from search metadata
         search_metadata = data.get("search_metadata", {})
         if search_metadata.get("google_lens_suggestion"):
@@ -556,14 +1116,14 @@ class ReverseImageSearchTool:
         # Process image results
         image_results = data.get("image_results", [])
         for item in image_results[:10]:  # Limit to first 10 image results
-            if item.get("original"):
-                similar_images.append(item["original"])
+            if len(similar_images) >= 5:
+                break
+            _add_image(item.get("original"))
         
         # Process inline images (more detailed results)
         inline_images = data.get("inline_images", [])
         for item in inline_images[:5]:  # Limit to first 5 detailed results
-            if item.get("original"):
-                similar_images.append(item["original"])
+            _add_image(item.get("original"))
             
             # Extract context page information
             if item.get("link") and item.get("title"):
@@ -596,36 +1156,34 @@ class ReverseImageSearchTool:
                 )
                 matching_pages.append(page_result)
         
-        # Remove duplicate images and sort by relevance
-        similar_images = list(dict.fromkeys(similar_images))  # Remove duplicates while preserving order
-        
         # Sort matching pages by tier quality (A > B > C)
         tier_order = {"A": 0, "B": 1, "C": 2}
         matching_pages.sort(key=lambda x: tier_order.get(x.tier, 1))
         
         return ReverseImageSearchResult(
-            similar_images=similar_images[:5],  # Return top 5 similar images
+            similar_images=similar_images,
             best_guess=best_guess or "No clear identification found",
             matching_pages=matching_pages[:5]  # Return top 5 context pages
         )
     
     async def _reverse_search_google_fallback(self, image_url: str) -> ReverseImageSearchResult:
         """Fallback reverse image search using Google Custom Search API."""
-        result = self.service.cse().list(
+        result = await self._cse_list(
             q=f"site:* {image_url}",  # Search for the image URL instead of using imgUrl
-            cx=settings.google_custom_search_engine_id,
             searchType="image",
             num=10,
             safe="active"
-        ).execute()
+        )
         
         similar_images = []
+        seen_images = set()
         matching_pages = []
         best_guess = None
         
         for item in result.get('items', []):
             image_link = item.get('link', '')
-            if image_link:
+            if image_link and image_link not in seen_images:
+                seen_images.add(image_link)
                 similar_images.append(image_link)
             
             if not best_guess and 'snippet' in item:
@@ -666,92 +1224,112 @@ class ReverseImageSearchTool:
                 matching_pages=[]
             )
         
+        key = _ResponseCache.make_key("reverse_image", image_url)
+        try:
+            result = await _reverse_image_cache.get_or_fetch(
+                key, lambda: self._reverse_search_providers(image_url)
+            )
+        except ToolError as e:
+            return ReverseImageSearchResult(
+                similar_images=[],
+                best_guess=str(e),
+                matching_pages=[]
+            )
+        # Cached results are shared; hand each caller its own copy
+        return result.model_copy(deep=True)
+    
+    async def _reverse_search_providers(self, image_url: str) -> ReverseImageSearchResult:
+        """Query the configured providers, raising ToolError when none succeed."""
         await self._apply_rate_limiting()
         
         # Try SERPAPI first (preferred)
         if self.serpapi_key and aiohttp:
             try:
-                return await self._reverse_search_serpapi(image_url)
+                return await _serpapi_breaker.call(self._reverse_search_serpapi, image_url)
             except Exception as e:
                 # Log SERPAPI failure and try Google fallback
                 pass
         
         # Fallback to Google Custom Search
-        if self.google_configured and self.service:
+        if await self._google_ready():
             try:
-                return await self._reverse_search_google_fallback(image_url)
+                return await _google_cse_breaker.call(self._reverse_search_google_fallback, image_url)
             except Exception as e:
-                return ReverseImageSearchResult(
-                    similar_images=[],
-                    best_guess=f"Reverse image search failed: {str(e)}",
-                    matching_pages=[]
-                )
+                raise ToolError(f"Reverse image search failed: {str(e)}")
         
-        # Final fallback - return mock result
-        return ReverseImageSearchResult(
-            similar_images=[],
-            best_guess="Reverse image search temporarily unavailable",
-            matching_pages=[]
-        )
+        # Final fallback - no provider could answer
+        raise ToolError("Reverse image search temporarily unavailable")
 
 
 class YouTubeMetadataTool:
     """Tool for fetching YouTube video and channel metadata."""
     
+    videos_endpoint = "https://www.googleapis.com/youtube/v3/videos"
+    channels_endpoint = "https://www.googleapis.com/youtube/v3/channels"
+    
     def __init__(self):
-        self.service = None
-        self.is_configured = bool(build and settings.youtube_api_key)
-        self.rate_limit_delay = 0.5  # YouTube has higher rate limits
-        self.last_request_time = 0
-        
-        if self.is_configured:
-            try:
-                self.service = build("youtube", "v3", developerKey=settings.youtube_api_key)
-            except Exception:
-                self.service = None
-                self.is_configured = False
+        self.service = None  # Built on first use, only needed without aiohttp
+        self._service_lock = asyncio.Lock()
+        self._build_lock = asyncio.Lock()
+        self.is_configured = bool((aiohttp or build) and settings.youtube_api_key)
+        
+        # (etag, metadata) per video, outliving the metadata cache so expired
+        # entries can be revalidated with If-None-Match instead of refetched
+        self._etags: TTLCache = TTLCache(maxsize=10_000, ttl=7 * 86400)
+        
+        # Lookups arriving within batch_window share one videos.list call
+        self.batch_window = 0.05  # seconds
+        self.max_batch_size = 50  # videos.list id limit
+        self._pending_videos: Dict[str, asyncio.Future] = {}
+        self._batch_timer: Optional[asyncio.Task] = None
+        self._batch_tasks = set()
+        
+        self._limiter = _youtube_limiter
+    
+    async def _ensure_service(self):
+        """Build the YouTube Data API client on first use, off the event loop."""
+        if self.service is None and self.is_configured:
+            async with self._build_lock:
+                if self.service is None and self.is_configured:
+                    try:
+                        self.service = await asyncio.to_thread(
+                            build, "youtube", "v3", developerKey=settings.youtube_api_key
+                        )
+                    except Exception:
+                        self.service = None
+                        self.is_configured = False
+        return self.service
+    
+    async def _ready(self) -> bool:
+        """Whether requests can be made; the discovery client is only built without aiohttp."""
+        if not self.is_configured:
+            return False
+        return aiohttp is not None or await self._ensure_service() is not None
     
     async def validate_api_key(self) -> bool:
         """Validate YouTube Data API key."""
-        if not self.is_configured or not self.service:
+        if not await self._ready():
             return False
         
         try:
             # Test with a simple query
-            response = self.service.videos().list(
-                part="snippet",
-                id="dQw4w9WgXcQ",  # Rick Roll video ID - always exists
-                maxResults=1
-            ).execute()
+            await self._videos_list("dQw4w9WgXcQ")  # Rick Roll video ID - always exists
             return True
         except Exception:
             return False
     
     async def _apply_rate_limiting(self):
         """Apply rate limiting between requests."""
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+        await self._limiter.wait_for_token()
     
     def extract_video_id(self, url_or_guess: str) -> Optional[str]:
         """Extract YouTube video ID from URL or guess with enhanced patterns."""
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/.*[?&]v=([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/shorts/([a-zA-Z0-9_-]{11})',  # YouTube Shorts
-            r'm\.youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',  # Mobile YouTube
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url_or_guess)
-            if match:
-                return match.group(1)
+        match = _YT_ID_RE.search(url_or_guess)
+        if match:
+            return match.group(1)
         
         # Direct video ID
-        if re.match(r'^[a-zA-Z0-9_-]{11}$', url_or_guess):
+        if _YT_DIRECT_ID.match(url_or_guess):
             return url_or_guess
         
         return None
@@ -764,14 +1342,11 @@ class YouTubeMetadataTool:
         channel_stats = channel_data.get("statistics", {}) if channel_data else {}
         
         # Check for news/official channels
-        channel_title = channel_snippet.get("title", "").lower()
+        channel_title = (channel_snippet.get("title") or snippet.get("channelTitle", "")).lower()
         description = snippet.get("description", "").lower()
         
         # Tier A: Official news channels, verified sources
-        if any(keyword in channel_title for keyword in [
-            'bbc', 'cnn', 'reuters', 'ap news', 'npr', 'pbs', 'abc news', 'cbs news',
-            'nbc news', 'fox news', 'sky news', 'the guardian', 'new york times'
-        ]):
+        if _TIER_A_CHANNEL_RE.search(channel_title):
             return "A"
         
         # High subscriber count with good engagement
@@ -787,42 +1362,197 @@ class YouTubeMetadataTool:
     
     async def get_metadata(self, url_or_guess: str) -> Optional[YouTubeMetadata]:
         """Get YouTube video metadata with enhanced error handling and classification."""
-        if not self.is_configured or not self.service:
+        if not await self._ready():
             return None
         
         video_id = self.extract_video_id(url_or_guess)
         if not video_id:
             return None
         
+        # Metadata rarely changes within a day; hits skip quota and rate limiting
+        metadata = await _youtube_metadata_cache.get_or_fetch(
+            video_id,
+            lambda: self._fetch_metadata(video_id),
+            should_cache=lambda metadata: metadata is not None
+        )
+        # Cached metadata is shared; hand each caller its own copy
+        return metadata.model_copy(deep=True) if metadata is not None else None
+    
+    async def get_metadata_many(self, urls_or_guesses: List[str]) -> List[Optional[YouTubeMetadata]]:
+        """Get metadata for several videos; concurrent lookups share batched API calls."""
+        results = await asyncio.gather(
+            *(self.get_metadata(url_or_guess) for url_or_guess in urls_or_guesses),
+            return_exceptions=True
+        )
+        return [None if isinstance(result, Exception) else result for result in results]
+    
+    async def _videos_list(self, video_ids: str, etag: Optional[str] = None) -> Tuple[int, Optional[str], dict]:
+        """Call videos.list for comma-separated ``video_ids``, conditionally on ``etag``
+        when aiohttp is available.
+        
+        Returns (status, etag, response); a 304 means the cached copy is current.
+        """
+        await self._apply_rate_limiting()
+        
+        max_results = video_ids.count(",") + 1
+        if not aiohttp:
+            response = await _execute_google_request(
+                self.service.videos().list(
+                    part="snippet,statistics,contentDetails",
+                    id=video_ids,
+                    maxResults=max_results
+                ),
+                self._service_lock
+            )
+            return 200, response.get("etag"), response
+        
+        params = {
+            "part": "snippet,statistics,contentDetails",
+            "id": video_ids,
+            "maxResults": max_results,
+            "key": settings.youtube_api_key,
+        }
+        headers = {"If-None-Match": etag} if etag else None
+        
+        async def _attempt():
+            session = await get_session()
+            async with session.get(self.videos_endpoint, params=params, headers=headers, timeout=_SEARCH_TIMEOUT) as resp:
+                if resp.status == 304:
+                    return 304, etag, {}
+                self._check_status(resp)
+                response = orjson.loads(await resp.read())
+                return 200, resp.headers.get("ETag") or response.get("etag"), response
+        
+        return await _youtube_breaker.call(
+            _retry_with_backoff, _attempt, base=0.5, max_delay=8.0, limiter=self._limiter
+        )
+    
+    async def _channels_list(self, channel_ids: str) -> dict:
+        """Call channels.list for comma-separated ``channel_ids``."""
         await self._apply_rate_limiting()
         
+        max_results = channel_ids.count(",") + 1
+        if not aiohttp:
+            return await _execute_google_request(
+                self.service.channels().list(
+                    part="snippet,statistics",
+                    id=channel_ids,
+                    maxResults=max_results
+                ),
+                self._service_lock
+            )
+        
+        params = {
+            "part": "snippet,statistics",
+            "id": channel_ids,
+            "maxResults": max_results,
+            "key": settings.youtube_api_key,
+        }
+        
+        async def _attempt():
+            session = await get_session()
+            async with session.get(self.channels_endpoint, params=params, timeout=_SEARCH_TIMEOUT) as resp:
+                self._check_status(resp)
+                return orjson.loads(await resp.read())
+        
+        return await _youtube_breaker.call(
+            _retry_with_backoff, _attempt, base=0.5, max_delay=8.0, limiter=self._limiter
+        )
+    
+    @staticmethod
+    def _check_status(resp):
+        if resp.status == 429:
+            raise RateLimitedError("YouTube API rate limited: 429", resp.headers.get("Retry-After"))
+        if resp.status in _TRANSIENT_STATUSES:
+            raise TransientError(f"YouTube API unavailable: {resp.status}", resp.headers.get("Retry-After"))
+        if resp.status >= 500:
+            raise ServerError(f"YouTube API returned status {resp.status}")
+        if resp.status != 200:
+            raise ToolError(f"YouTube API returned status {resp.status}")
+    
+    async def _channels_for(self, videos: List[dict]) -> Dict[str, dict]:
+        """Fetch the distinct channels of ``videos`` in one channels.list call, keyed by id.
+        
+        Videos whose channelTitle already marks them as tier A are skipped;
+        channel statistics only matter for telling B from C.
+        """
+        channel_ids = {
+            video.get("snippet", {}).get("channelId")
+            for video in videos
+            if not _TIER_A_CHANNEL_RE.search(video.get("snippet", {}).get("channelTitle", "").lower())
+        } - {None}
+        if not channel_ids:
+            return {}
+        try:
+            response = await self._channels_list(",".join(channel_ids))
+        except Exception:
+            return {}  # Continue without channel data if it fails
+        return {item.get("id"): item for item in response.get("items", [])}
+    
+    async def _lookup_video(self, video_id: str) -> Tuple[Optional[str], Optional[dict], Dict[str, dict]]:
+        """Queue a video for the next batched videos.list call.
+        
+        Returns (etag, video item, channels by id). The etag is only set when
+        the video went out alone, since a multi-id response's ETag can't
+        revalidate one video.
+        """
+        future = self._pending_videos.get(video_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_videos[video_id] = future
+            if len(self._pending_videos) >= self.max_batch_size:
+                batch, self._pending_videos = self._pending_videos, {}
+                task = asyncio.create_task(self._flush_video_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+            elif self._batch_timer is None:
+                self._batch_timer = asyncio.create_task(self._run_video_batch())
+        # Shield so one cancelled caller doesn't fail the others sharing the call
+        return await asyncio.shield(future)
+    
+    async def _run_video_batch(self):
+        await asyncio.sleep(self.batch_window)
+        self._batch_timer = None
+        batch, self._pending_videos = self._pending_videos, {}
+        if batch:
+            await self._flush_video_batch(batch)
+    
+    async def _flush_video_batch(self, batch: Dict[str, asyncio.Future]):
         try:
-            # Get video details
-            video_response = self.service.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=video_id,
-                maxResults=1
-            ).execute()
+            _, etag, response = await self._videos_list(",".join(batch))
+            if len(batch) > 1:
+                etag = None
+            items = {item.get("id"): item for item in response.get("items", [])}
+            # One channels.list call covers every channel in the batch
+            channels = await self._channels_for(list(items.values()))
+            for video_id, future in batch.items():
+                if not future.done():
+                    future.set_result((etag, items.get(video_id), channels))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+    
+    async def _fetch_metadata(self, video_id: str) -> Optional[YouTubeMetadata]:
+        """Fetch and classify metadata for one video from the YouTube Data API."""
+        try:
+            # Get video details, revalidating a previously seen copy if we have one
+            known = self._etags.get(video_id)
+            if known:
+                status, etag, video_response = await self._videos_list(video_id, known[0])
+                if status == 304:
+                    return known[1]
+                video = (video_response.get("items") or [None])[0]
+                channels = await self._channels_for([video]) if video else {}
+            else:
+                etag, video, channels = await self._lookup_video(video_id)
             
-            if not video_response.get("items"):
+            if not video:
                 return None
             
-            video = video_response["items"][0]
             snippet = video["snippet"]
             statistics = video.get("statistics", {})
-            
-            # Get channel details
-            channel_data = None
-            try:
-                channel_response = self.service.channels().list(
-                    part="snippet,statistics",
-                    id=snippet["channelId"],
-                    maxResults=1
-                ).execute()
-                if channel_response.get("items"):
-                    channel_data = channel_response["items"][0]
-            except Exception:
-                pass  # Continue without channel data if it fails
+            channel_data = channels.get(snippet["channelId"])
             
             # Classify content tier
             tier = self._classify_content_tier(channel_data, video)
@@ -836,11 +1566,12 @@ class YouTubeMetadataTool:
                 category=snippet.get("categoryId"),
                 publishedAt=snippet.get("publishedAt"),
                 viewCount=int(statistics.get("viewCount", 0)),
-                likeCount=int(statistics.get("likeCount", 0))
+                likeCount=int(statistics.get("likeCount", 0)),
+                tier=tier
             )
             
-            # Add tier classification
-            metadata.tier = tier
+            if etag:
+                self._etags[video_id] = (etag, metadata)
             
             return metadata
             
@@ -851,29 +1582,22 @@ class YouTubeMetadataTool:
 class TikTokMetadataTool:
     """Tool for fetching TikTok video metadata with enhanced parsing."""
     
+    # Stop reading a scraped page once the title is seen and this much is scanned
+    scan_bytes = 32 * 1024
+    # Never read more than this of a page, even if no title shows up
+    max_head_bytes = 512 * 1024
+    
     def __init__(self):
-        self.rate_limit_delay = 2.0  # TikTok is more restrictive
-        self.last_request_time = 0
+        self._limiter = _tiktok_limiter
     
     async def _apply_rate_limiting(self):
         """Apply rate limiting between requests."""
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+        await self._limiter.wait_for_token()
     
     def extract_video_info(self, url_or_guess: str) -> Optional[Dict[str, str]]:
         """Extract TikTok video information from URL patterns."""
-        patterns = [
-            r'tiktok\.com/@([^/]+)/video/(\d+)',
-            r'tiktok\.com/t/([a-zA-Z0-9]+)',  # Short links
-            r'vm\.tiktok\.com/([a-zA-Z0-9]+)',  # Mobile short links
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url_or_guess)
+        for pattern in _TT_PATTERNS:
+            match = pattern.search(url_or_guess)
             if match:
                 if len(match.groups()) == 2:
                     return {"username": match.group(1), "video_id": match.group(2)}
@@ -882,6 +1606,33 @@ class TikTokMetadataTool:
         
         return None
     
+    async def _read_head(self, response) -> bytes:
+        """Read the page only until the title has been seen and scan_bytes scanned."""
+        marker = b"</title>"
+        buf = bytearray()
+        title_seen = False
+        async for chunk in response.content.iter_chunked(8192):
+            # Only search the new bytes, plus enough overlap to catch a split marker
+            start = max(0, len(buf) - len(marker) + 1)
+            buf += chunk
+            if not title_seen:
+                title_seen = marker in buf[start:].lower()
+            if len(buf) >= self.max_head_bytes:
+                return bytes(buf[:self.max_head_bytes])
+            if title_seen and len(buf) >= self.scan_bytes:
+                break
+        return bytes(buf)
+    
+    def _extract_title(self, content: bytes, charset: Optional[str]) -> Optional[str]:
+        if HTMLParser is not None:
+            node = HTMLParser(content).css_first("title")
+            title = node.text(strip=True) if node is not None else ""
+            return title or None
+        title_match = _TT_TITLE_RE.search(content)
+        if title_match:
+            return title_match.group(1).decode(charset or "utf-8", errors="replace")
+        return None
+    
     async def get_metadata(self, url_or_guess: str) -> Optional[Dict[str, Any]]:
         """Get TikTok video metadata with enhanced parsing and classification."""
         await self._apply_rate_limiting()
@@ -905,19 +1656,20 @@ class TikTokMetadataTool:
                             headers = {
                                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                             }
-                            async with aiohttp.ClientSession() as session:
-                                async with session.get(url_or_guess, headers=headers, timeout=10) as response:
-                                    if response.status == 200:
-                                        content = await response.text()
-                                        
-                                        # Extract basic metadata from HTML
-                                        title_match = re.search(r'<title>([^<]+)</title>', content)
-                                        if title_match:
-                                            result["title"] = title_match.group(1)
-                                        
-                                        # Look for verified accounts (higher tier)
-                                        if "verified" in content.lower() or "official" in content.lower():
-                                            result["tier"] = "B"
+                            session = await get_session()
+                            async with session.get(url_or_guess, headers=headers, timeout=_FETCH_TIMEOUT) as response:
+                                if response.status == 200:
+                                    content = await self._read_head(response)
+                                    
+                                    # Extract basic metadata from HTML
+                                    title = self._extract_title(content, response.charset)
+                                    if title:
+                                        result["title"] = title
+                                    
+                                    # Look for verified accounts (higher tier)
+                                    content = content.lower()
+                                    if b"verified" in content or b"official" in content:
+                                        result["tier"] = "B"
                         except Exception:
                             pass  # Continue with basic info if scraping fails
                     
@@ -940,8 +1692,9 @@ class FactCheckTool:
     
     def __init__(self):
         self.web_search = WebSearchTool()
-        self.rate_limit_delay = 1.0
-        self.last_request_time = 0
+        self._limiter = _fact_check_limiter
+        # Caps searches in flight across concurrent claim checks
+        self._search_slots = asyncio.Semaphore(8)
         
         # Define fact-checking source tiers
         self.tier_a_sources = [
@@ -952,6 +1705,16 @@ class FactCheckTool:
             'fullfact.org', 'checkyourfact.com', 'leadstories.com',
             'factcheckni.org', 'afp.com/factcheck'
         ]
+        
+        # Registered domain -> [(path prefix, tier, confidence)]; a lookup is one
+        # dict hit per hostname suffix instead of a scan over every source
+        self._domain_tier: Dict[str, List[Tuple[str, str, float]]] = {}
+        for sources, tier, confidence in ((self.tier_a_sources, "A", 0.95), (self.tier_b_sources, "B", 0.85)):
+            for source in sources:
+                domain, _, path = source.partition('/')
+                self._domain_tier.setdefault(domain, []).append(('/' + path if path else '', tier, confidence))
+        # The same sources recur across a claim's queries and across claims
+        self._source_tier_cache: LRUCache = LRUCache(maxsize=2048)
     
     async def validate_api_dependencies(self) -> bool:
         """Check if web search dependency is available."""
@@ -959,27 +1722,31 @@ class FactCheckTool:
     
     async def _apply_rate_limiting(self):
         """Apply rate limiting between requests."""
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+        await self._limiter.wait_for_token()
     
     def _classify_fact_check_source(self, url: str) -> tuple[str, float]:
         """Classify fact-checking source and return tier and base confidence."""
-        url_lower = url.lower()
-        
-        for source in self.tier_a_sources:
-            if source in url_lower:
-                return "A", 0.95
-        
-        for source in self.tier_b_sources:
-            if source in url_lower:
-                return "B", 0.85
+        classification = self._source_tier_cache.get(url)
+        if classification is None:
+            classification = self._source_tier_cache[url] = self._lookup_source_tier(url)
+        return classification
+    
+    def _lookup_source_tier(self, url: str) -> tuple[str, float]:
+        try:
+            parsed = urlparse(url)
+            host, path = parsed.hostname or "", parsed.path.lower()
+        except ValueError:
+            host, path = "", ""
+        
+        # Try the host and each parent domain, so www. and other subdomains match
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            for prefix, tier, confidence in self._domain_tier.get('.'.join(labels[i:]), ()):
+                if path.startswith(prefix):
+                    return tier, confidence
         
         # Check for general news fact-checking sections
-        if any(pattern in url_lower for pattern in ['fact-check', 'factcheck', 'reality-check']):
+        if _FACT_CHECK_PATH_RE.search(url.lower()):
             return "B", 0.75
         
         return "C", 0.60
@@ -988,24 +1755,11 @@ class FactCheckTool:
         """Extract claim status from snippet and title with confidence scoring."""
         text = (snippet + " " + title).lower()
         
-        # Define status indicators with confidence weights
-        false_indicators = ['false', 'debunked', 'misleading', 'incorrect', 'wrong', 'fabricated']
-        true_indicators = ['true', 'verified', 'confirmed', 'accurate', 'correct']
-        contested_indicators = ['partly', 'mixed', 'partially', 'mostly false', 'mostly true', 'needs context']
-        uncertain_indicators = ['unclear', 'unverified', 'no evidence', 'unknown']
-        
-        # Count weighted indicators
-        false_score = sum(2 if indicator in text else 0 for indicator in false_indicators)
-        true_score = sum(2 if indicator in text else 0 for indicator in true_indicators)
-        contested_score = sum(1.5 if indicator in text else 0 for indicator in contested_indicators)
-        uncertain_score = sum(1 if indicator in text else 0 for indicator in uncertain_indicators)
-        
-        scores = {
-            'false': false_score,
-            'supported': true_score,
-            'contested': contested_score,
-            'uncertain': uncertain_score
-        }
+        # Each indicator present counts once toward its verdict
+        scores = {'false': 0, 'supported': 0, 'contested': 0, 'uncertain': 0}
+        for indicator in set(_CLAIM_STATUS_RE.findall(text)):
+            status, weight = _CLAIM_STATUS_INDICATORS[indicator]
+            scores[status] += weight
         
         if max(scores.values()) == 0:
             return "uncertain", 0.3
@@ -1015,6 +1769,10 @@ class FactCheckTool:
         
         return status, confidence
     
+    async def _search(self, query: str) -> List[WebSearchResult]:
+        async with self._search_slots:
+            return await self.web_search.search(query, max_results=4)
+    
     async def check_claim(self, statement: str) -> Dict[str, Any]:
         """Check a claim with enhanced consensus logic and source validation."""
         await self._apply_rate_limiting()
@@ -1036,26 +1794,23 @@ class FactCheckTool:
                 f'fact check "{statement[:50]}"',  # Truncate long statements
             ]
             
-            all_results = []
-            for query in search_queries:
-                try:
-                    results = await self.web_search.search(query, max_results=4)
-                    all_results.extend(results)
-                except Exception as e:
-                    continue  # Continue with other queries if one fails
+            # Run the queries concurrently; a failed query just contributes nothing
+            results_lists = await asyncio.gather(
+                *(self._search(query) for query in search_queries),
+                return_exceptions=True
+            )
+            all_results = [
+                result
+                for results in results_lists if not isinstance(results, BaseException)
+                for result in results
+            ]
             
-            # Remove duplicates by URL
-            seen_urls = set()
-            unique_results = []
+            # Dedup by URL in the same pass, keeping the highest-confidence reading
+            records: Dict[str, Dict[str, Any]] = {}
             for result in all_results:
-                if result.url not in seen_urls:
-                    seen_urls.add(result.url)
-                    unique_results.append(result)
-            
-            fact_check_sources = []
-            weighted_votes = {'false': 0, 'supported': 0, 'contested': 0, 'uncertain': 0}
-            
-            for result in unique_results[:10]:  # Limit to top 10 results
+                if result.url not in records and len(records) >= 10:  # Limit to top 10 results
+                    continue
+                
                 tier, base_confidence = self._classify_fact_check_source(result.url)
                 status, status_confidence = self._extract_claim_status(result.snippet, result.title)
                 
@@ -1070,12 +1825,17 @@ class FactCheckTool:
                     "confidence": final_confidence,
                     "snippet": result.snippet[:200]  # Truncate snippet
                 }
-                fact_check_sources.append(source_data)
-                
-                # Weight votes by tier and confidence
-                tier_weight = {"A": 3.0, "B": 2.0, "C": 1.0}[tier]
-                vote_weight = final_confidence * tier_weight
-                weighted_votes[status] += vote_weight
+                known = records.get(result.url)
+                if known is None or final_confidence > known["confidence"]:
+                    records[result.url] = source_data
+            
+            fact_check_sources = list(records.values())
+            weighted_votes = {'false': 0, 'supported': 0, 'contested': 0, 'uncertain': 0}
+            
+            # Weight votes by tier and confidence
+            tier_weights = {"A": 3.0, "B": 2.0, "C": 1.0}
+            for source_data in fact_check_sources:
+                weighted_votes[source_data["status"]] += source_data["confidence"] * tier_weights[source_data["tier"]]
             
             # Calculate consensus
             if not fact_check_sources:
@@ -1130,9 +1890,117 @@ class FactCheckTool:
         return f"{base_text} based on {source_count} fact-checking source(s)."
 
 
+# Tool schemas advertised to the LLM; built once and shared by every caller
+_TOOL_DESCRIPTIONS: List[Dict[str, Any]] = [
+    {
+        "name": "web_search",
+        "description": "Search the web for information",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 5
+                }
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "fetch_url",
+        "description": "Fetch content from a specific URL",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to fetch content from"
+                },
+                "max_chars": {
+                    "type": "integer",
+                    "description": "Maximum characters to return",
+                    "default": 5000
+                }
+            },
+            "required": ["url"]
+        }
+    },
+    {
+        "name": "reverse_image_search",
+        "description": "Perform reverse image search",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "image_url": {
+                    "type": "string",
+                    "description": "URL of the image to search for"
+                }
+            },
+            "required": ["image_url"]
+        }
+    },
+    {
+        "name": "yt_meta",
+        "description": "Get YouTube video metadata",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "url_or_guess": {
+                    "type": "string",
+                    "description": "YouTube URL or video ID"
+                }
+            },
+            "required": ["url_or_guess"]
+        }
+    },
+    {
+        "name": "tiktok_meta",
+        "description": "Get TikTok video metadata",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "url_or_guess": {
+                    "type": "string",
+                    "description": "TikTok URL or video identifier"
+                }
+            },
+            "required": ["url_or_guess"]
+        }
+    },
+    {
+        "name": "claim_check", 
+        "description": "Check a factual claim against fact-checking databases",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "statement": {
+                    "type": "string",
+                    "description": "The claim or statement to fact-check"
+                }
+            },
+            "required": ["statement"]
+        }
+    }
+]
+_TOOL_DESCRIPTIONS_JSON = orjson.dumps(_TOOL_DESCRIPTIONS)
+
+
 class ToolRegistry:
     """Enhanced registry for all available tools with health checking and validation."""
     
+    _FALLBACK_MESSAGES = {
+        "web_search": "Web search unavailable - requires Bing Search API key configuration",
+        "reverse_image_search": "Reverse image search unavailable - requires Google Custom Search API",
+        "youtube_meta": "YouTube metadata unavailable - requires YouTube Data API key",
+        "fact_check": "Fact checking unavailable - depends on web search functionality",
+        "url_fetch": "URL fetching unavailable - requires aiohttp dependency"
+    }
+    
     def __init__(self):
         self.web_search = WebSearchTool()
         self.url_fetch = URLFetchTool()
@@ -1141,54 +2009,102 @@ class ToolRegistry:
         self.tiktok_meta = TikTokMetadataTool()
         self.fact_check = FactCheckTool()
         
+        # Handlers by tool name. The LLM-facing names (yt_meta, claim_check,
+        # fetch_url) and the health-status names are both accepted.
+        self._dispatch: Dict[str, Callable[..., Awaitable[Any]]] = {
+            "web_search": self.web_search.search,
+            "fetch_url": self.url_fetch.fetch_url,
+            "url_fetch": self.url_fetch.fetch_url,
+            "reverse_image_search": self.reverse_image_search.reverse_search,
+            "yt_meta": self.youtube_meta.get_metadata,
+            "youtube_meta": self.youtube_meta.get_metadata,
+            "tiktok_meta": self.tiktok_meta.get_metadata,
+            "claim_check": self.fact_check.check_claim,
+            "fact_check": self.fact_check.check_claim,
+        }
+        # LLM-facing names mapped to the key their health status is tracked under
+        self._status_names = {"fetch_url": "url_fetch", "yt_meta": "youtube_meta", "claim_check": "fact_check"}
+        
+        # Provider breakers, keyed for the /system/circuit-breakers endpoint
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {
+            "tools.serpapi": _serpapi_breaker,
+            "tools.bing": _bing_breaker,
+            "tools.google_cse": _google_cse_breaker,
+            "tools.youtube": _youtube_breaker,
+        }
+        
         # Track tool health status
         self._health_status = {}
         self._last_health_check = 0
         self._health_check_interval = 300  # 5 minutes
+        self._health_lock = asyncio.Lock()
+        self._available: frozenset = frozenset()
     
     async def validate_all_tools(self) -> Dict[str, Dict[str, Any]]:
         """Validate all tools and return their status."""
         import time
-        current_time = time.time()
         
         # Use cached health status if recent
-        if (current_time - self._last_health_check) < self._health_check_interval and self._health_status:
+        if (time.time() - self._last_health_check) < self._health_check_interval and self._health_status:
             return self._health_status
         
+        # Concurrent callers on a cold cache share one round of checks
+        async with self._health_lock:
+            current_time = time.time()
+            if (current_time - self._last_health_check) < self._health_check_interval and self._health_status:
+                return self._health_status
+            
+            status = await self._check_tools()
+            
+            self._health_status = status
+            self._available = frozenset(
+                tool_name for tool_name, tool_status in status.items() if tool_status.get("available", False)
+            )
+            self._last_health_check = current_time
+        
+        return status
+    
+    async def _check_tools(self) -> Dict[str, Dict[str, Any]]:
+        # The network-bound checks are independent, so run them together
+        web_search_valid, image_search_valid, youtube_valid, fact_check_valid = await asyncio.gather(
+            self.web_search.validate_api_key(),
+            self.reverse_image_search.validate_api_key(),
+            self.youtube_meta.validate_api_key(),
+            self.fact_check.validate_api_dependencies(),
+            return_exceptions=True
+        )
+        
         status = {}
         
         # Check Web Search
-        try:
-            web_search_valid = await self.web_search.validate_api_key()
+        if isinstance(web_search_valid, Exception):
+            status["web_search"] = {"available": False, "configured": False, "error": str(web_search_valid)}
+        else:
             status["web_search"] = {
                 "available": web_search_valid,
                 "configured": self.web_search.is_configured,
                 "status": "ready" if web_search_valid else "api_key_required"
             }
-        except Exception as e:
-            status["web_search"] = {"available": False, "configured": False, "error": str(e)}
         
         # Check Reverse Image Search
-        try:
-            image_search_valid = await self.reverse_image_search.validate_api_key()
+        if isinstance(image_search_valid, Exception):
+            status["reverse_image_search"] = {"available": False, "configured": False, "error": str(image_search_valid)}
+        else:
             status["reverse_image_search"] = {
                 "available": image_search_valid,
                 "configured": self.reverse_image_search.is_configured,
                 "status": "ready" if image_search_valid else "api_key_required"
             }
-        except Exception as e:
-            status["reverse_image_search"] = {"available": False, "configured": False, "error": str(e)}
         
         # Check YouTube
-        try:
-            youtube_valid = await self.youtube_meta.validate_api_key()
+        if isinstance(youtube_valid, Exception):
+            status["youtube_meta"] = {"available": False, "configured": False, "error": str(youtube_valid)}
+        else:
             status["youtube_meta"] = {
                 "available": youtube_valid,
                 "configured": self.youtube_meta.is_configured,
                 "status": "ready" if youtube_valid else "api_key_required"
             }
-        except Exception as e:
-            status["youtube_meta"] = {"available": False, "configured": False, "error": str(e)}
         
         # TikTok (no API validation needed)
         status["tiktok_meta"] = {
@@ -1205,85 +2121,53 @@ class ToolRegistry:
         }
         
         # Fact Check (depends on web search)
-        try:
-            fact_check_valid = await self.fact_check.validate_api_dependencies()
+        if isinstance(fact_check_valid, Exception):
+            status["fact_check"] = {"available": False, "configured": False, "error": str(fact_check_valid)}
+        else:
             status["fact_check"] = {
                 "available": fact_check_valid,
                 "configured": fact_check_valid,
                 "status": "ready" if fact_check_valid else "depends_on_web_search"
             }
-        except Exception as e:
-            status["fact_check"] = {"available": False, "configured": False, "error": str(e)}
-        
-        self._health_status = status
-        self._last_health_check = current_time
         
         return status
     
     async def get_available_tools(self) -> List[str]:
         """Get list of currently available tool names."""
-        status = await self.validate_all_tools()
-        return [tool_name for tool_name, tool_status in status.items() if tool_status.get("available", False)]
+        await self.validate_all_tools()
+        return list(self._available)
     
     def get_fallback_message(self, tool_name: str) -> str:
         """Get fallback message when tool is unavailable."""
-        messages = {
-            "web_search": "Web search unavailable - requires Bing Search API key configuration",
-            "reverse_image_search": "Reverse image search unavailable - requires Google Custom Search API",
-            "youtube_meta": "YouTube metadata unavailable - requires YouTube Data API key",
-            "fact_check": "Fact checking unavailable - depends on web search functionality",
-            "url_fetch": "URL fetching unavailable - requires aiohttp dependency"
-        }
+        return self._FALLBACK_MESSAGES.get(tool_name, f"Tool {tool_name} unavailable")
+    
     async def call_tool_with_monitoring(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """Call a tool with performance monitoring and error handling."""
         import time
         start_time = time.time()
         
         try:
-            # Check if tool is available
-            available_tools = await self.get_available_tools()
-            if tool_name not in available_tools:
+            handler = self._dispatch.get(tool_name)
+            if handler is None:
                 return {
-                    "error": self.get_fallback_message(tool_name),
-                    "status": "unavailable",
+                    "error": f"Unknown tool: {tool_name}",
+                    "status": "unknown_tool",
                     "execution_time": 0
                 }
             
-            # Call the appropriate tool
-            result = None
-            if tool_name == "web_search":
-                result = await self.web_search.search(
-                    kwargs.get("query", ""),
-                    kwargs.get("max_results", 5)
-                )
-            elif tool_name == "fetch_url":
-                result = await self.url_fetch.fetch_url(
-                    kwargs.get("url", ""),
-                    kwargs.get("max_chars", 5000)
-                )
-            elif tool_name == "reverse_image_search":
-                result = await self.reverse_image_search.reverse_search(
-                    kwargs.get("image_url", "")
-                )
-            elif tool_name == "youtube_meta":
-                result = await self.youtube_meta.get_metadata(
-                    kwargs.get("url_or_guess", "")
-                )
-            elif tool_name == "tiktok_meta":
-                result = await self.tiktok_meta.get_metadata(
-                    kwargs.get("url_or_guess", "")
-                )
-            elif tool_name == "fact_check":
-                result = await self.fact_check.check_claim(
-                    kwargs.get("statement", "")
-                )
-            else:
+            # Check if tool is available, revalidating only once the cached check expires
+            status_name = self._status_names.get(tool_name, tool_name)
+            if status_name not in self._available and (time.time() - self._last_health_check) >= self._health_check_interval:
+                await self.validate_all_tools()
+            if status_name not in self._available:
                 return {
-                    "error": f"Unknown tool: {tool_name}",
-                    "status": "unknown_tool",
+                    "error": self.get_fallback_message(status_name),
+                    "status": "unavailable",
                     "execution_time": 0
                 }
             
+            result = await handler(**kwargs)
+            
             execution_time = time.time() - start_time
             
             return {
@@ -1311,120 +2195,22 @@ class ToolRegistry:
             }
     
     def get_tool_descriptions(self) -> List[Dict[str, Any]]:
-        """Get tool descriptions for LLM function calling."""
-        return [
-            {
-                "name": "web_search",
-                "description": "Search the web for information",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query"
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of results to return",
-                            "default": 5
-                        }
-                    },
-                    "required": ["query"]
-                }
-            },
-            {
-                "name": "fetch_url",
-                "description": "Fetch content from a specific URL",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to fetch content from"
-                        },
-                        "max_chars": {
-                            "type": "integer",
-                            "description": "Maximum characters to return",
-                            "default": 5000
-                        }
-                    },
-                    "required": ["url"]
-                }
-            },
-            {
-                "name": "reverse_image_search",
-                "description": "Perform reverse image search",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "image_url": {
-                            "type": "string",
-                            "description": "URL of the image to search for"
-                        }
-                    },
-                    "required": ["image_url"]
-                }
-            },
-            {
-                "name": "yt_meta",
-                "description": "Get YouTube video metadata",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "url_or_guess": {
-                            "type": "string",
-                            "description": "YouTube URL or video ID"
-                        }
-                    },
-                    "required": ["url_or_guess"]
-                }
-            },
-            {
-                "name": "tiktok_meta",
-                "description": "Get TikTok video metadata",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "url_or_guess": {
-                            "type": "string",
-                            "description": "TikTok URL or video identifier"
-                        }
-                    },
-                    "required": ["url_or_guess"]
-                }
-            },
-            {
-                "name": "claim_check", 
-                "description": "Check a factual claim against fact-checking databases",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "statement": {
-                            "type": "string",
-                            "description": "The claim or statement to fact-check"
-                        }
-                    },
-                    "required": ["statement"]
-                }
-            }
-        ]
+        """Get tool descriptions for LLM function calling.
+        
+        The list is shared; callers must not mutate it.
+        """
+        return _TOOL_DESCRIPTIONS
+    
+    def get_tool_descriptions_json(self) -> bytes:
+        """Get the tool descriptions pre-serialized as JSON bytes."""
+        return _TOOL_DESCRIPTIONS_JSON
     
     async def call_tool(self, tool_name: str, **kwargs) -> Any:
         """Call a tool function by name."""
-        if tool_name == "web_search":
-            return await self.web_search.search(**kwargs)
-        elif tool_name == "fetch_url":
-            return await self.url_fetch.fetch_url(**kwargs)
-        elif tool_name == "reverse_image_search":
-            return await self.reverse_image_search.reverse_search(**kwargs)
-        elif tool_name == "yt_meta":
-            return await self.youtube_meta.get_metadata(**kwargs)
-        elif tool_name == "tiktok_meta":
-            return await self.tiktok_meta.get_metadata(**kwargs)
-        elif tool_name == "claim_check":
-            return await self.fact_check.check_claim(**kwargs)
-        else:
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
             raise ToolError(f"Unknown tool: {tool_name}")
+        return await handler(**kwargs)
 
 
 # Global tool registry instance
@@ -0,0 +1,46 @@
+"""Tests for expiry of sessions held in the in-memory fallback."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.session_service import SessionManager
+
+
+def _store(manager: SessionManager, session_id: str, settings_data: dict):
+    manager._store_in_memory(session_id, manager._build_session_memory(settings_data))
+
+
+@pytest.mark.asyncio
+async def test_cleanup_keeps_sessions_that_have_not_expired():
+    manager = SessionManager()
+    _store(manager, "time", {"sessionType": {"type": "TIME", "minutes": 60}})
+    _store(manager, "manual", {"sessionType": {"type": "MANUAL"}})
+
+    await manager.cleanup_expired_sessions()
+
+    assert "time" in manager.sessions
+    assert "manual" in manager.sessions
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_time_session_past_its_limit():
+    manager = SessionManager()
+    manager._started_at["old"] = datetime.utcnow() - timedelta(minutes=61)
+    _store(manager, "old", {"sessionType": {"type": "TIME", "minutes": 60}})
+
+    await manager.cleanup_expired_sessions()
+
+    assert "old" not in manager.sessions
+
+
+def test_expiry_counts_from_first_store():
+    manager = SessionManager()
+    _store(manager, "time", {"sessionType": {"type": "TIME", "minutes": 60}})
+    first_expiry = manager._expiry_at["time"]
+
+    # Later writes of the same session keep the original start time
+    _store(manager, "time", {"sessionType": {"type": "TIME", "minutes": 60}})
+
+    assert manager._expiry_at["time"] == first_expiry
+    assert len(manager._expiry_heap) == 1
@@ -208,4 +208,9 @@ async def main():
     print_summary()
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Linux/macOS only
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -6,48 +6,119 @@ Test Settings Integration - Verify that all settings work correctly with the bac
 import asyncio
 import aiohttp
 import json
+import orjson
+import sys
 from datetime import datetime
 
+async def post_json(session, url, payload, attempts=2, backoff=0.05):
+    """POST a payload and return (status, raw body).
+    
+    Connection failures (backend restarting, listen backlog full) are retried
+    with exponential backoff; any other error is raised straight away.
+    """
+    # Serialize with orjson up front; the session already sends the JSON content type
+    body = orjson.dumps(payload)
+    for attempt in range(attempts):
+        try:
+            async with session.post(url, data=body) as response:
+                return response.status, await response.read()
+        except aiohttp.ClientConnectorError:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(backoff * 2 ** attempt)
+
 async def test_settings_integration():
     """Test the complete settings workflow"""
     base_url = "http://localhost:8000"
+    batch_url = f"{base_url}/sessions/batch"
     
-    async with aiohttp.ClientSession() as session:
+    # One pooled keep-alive connector for the whole run, so every case reuses
+    # sockets to localhost:8000 instead of opening a new connection
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=32,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True
+    )
+    # Fail fast if the backend stalls instead of holding sockets for aiohttp's
+    # five-minute default; cleanup gets an even shorter budget
+    timeout = aiohttp.ClientTimeout(total=5, connect=1, sock_read=4)
+    cleanup_timeout = aiohttp.ClientTimeout(total=2)
+    
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={"Content-Type": "application/json"}
+    ) as session:
+        # Persistent sessions are removed with one batch DELETE at the end
+        created_ids = []
+        
+        async def run_section(payloads, template_id=None, persistent_index=0):
+            """Create one session per payload in a single batch request.
+            
+            With ``template_id`` the payloads are overrides of that server-side
+            settings template. Every case but ``persistent_index`` (a case that
+            should be accepted) asks to be ephemeral, so the backend expires it on
+            its own and that one case still goes through the DELETE path. Returns
+            one (status, session_id, body) tuple per payload, in order, or the
+            raised exception for every payload if the batch itself failed.
+            """
+            body = {"sessions": [
+                payload if index == persistent_index else {**payload, "ephemeral": True}
+                for index, payload in enumerate(payloads)
+            ]}
+            if template_id:
+                body["template_id"] = template_id
+            try:
+                status, raw = await post_json(session, batch_url, body)
+                if status == 404 and template_id:
+                    # The template has expired or is unknown to this backend;
+                    # resend the cases as full payloads
+                    return await run_section(
+                        [{**base_payload, **payload} for payload in payloads],
+                        persistent_index=persistent_index
+                    )
+                if status != 200:
+                    raise RuntimeError(f"Batch request failed (Status: {status})")
+                results = orjson.loads(raw)["results"]
+            except Exception as e:
+                return [e] * len(payloads)
+            
+            outcomes = []
+            for result in results:
+                session_id = result.get('session_id')
+                # The backend only honours "ephemeral" when it allows it, so
+                # delete whatever it reports as persistent
+                if session_id and not result.get('ephemeral'):
+                    created_ids.append(session_id)
+                outcomes.append((result['status'], session_id, result))
+            return outcomes
+        
         print("🎛️  Testing Checkmate Settings Integration")
         print("=" * 50)
         
+        # Sections 1-3 vary one field of this payload. It is registered once as
+        # a server-side template so those cases only send the field they change;
+        # if that fails they fall back to full payloads built from the base
+        base_payload = {
+            "sessionType": {"type": "MANUAL"},
+            "strictness": 0.5,
+            "notify": {"details": True, "links": True}
+        }
+        template_id = None
+        try:
+            status, raw = await post_json(session, f"{base_url}/sessions/templates", base_payload)
+            if status == 200:
+                template_id = orjson.loads(raw)["template_id"]
+        except Exception as e:
+            print(f"⚠️  Settings template unavailable, sending full payloads - {e}")
+        base_overrides = {} if template_id else base_payload
+        
         # Test 1: Create session with different strictness levels
-        print("\n1. Testing Strictness Levels (Backend Validation):")
         strictness_levels = [0.0, 0.2, 0.4, 0.5, 0.6, 0.8, 1.0]
         
-        for strictness in strictness_levels:
-            session_data = {
-                "sessionType": {"type": "MANUAL"},
-                "strictness": strictness,
-                "notify": {"details": True, "links": True}
-            }
-            
-            try:
-                async with session.post(
-                    f"{base_url}/sessions", 
-                    json=session_data,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        print(f"   ✅ Strictness {strictness}: Session created (ID: {result.get('sessionId', 'Unknown')[:8]}...)")
-                        
-                        # Clean up session
-                        if result.get('sessionId'):
-                            async with session.delete(f"{base_url}/sessions/{result['sessionId']}") as cleanup_response:
-                                pass
-                    else:
-                        print(f"   ❌ Strictness {strictness}: Failed (Status: {response.status})")
-            except Exception as e:
-                print(f"   ❌ Strictness {strictness}: Error - {e}")
-        
         # Test 2: Session types
-        print("\n2. Testing Session Types:")
         session_types = [
             {"type": "MANUAL", "description": "Manual session"},
             {"type": "TIME", "minutes": 60, "description": "1-hour time-boxed session"},
@@ -55,34 +126,7 @@ async def test_settings_integration():
             {"type": "ACTIVITY", "description": "Activity-based session"}
         ]
         
-        for session_type_config in session_types:
-            session_data = {
-                "sessionType": session_type_config,
-                "strictness": 0.5,
-                "notify": {"details": True, "links": True}
-            }
-            
-            try:
-                async with session.post(
-                    f"{base_url}/sessions", 
-                    json=session_data,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        print(f"   ✅ {session_type_config['description']}: Created successfully")
-                        
-                        # Clean up session
-                        if result.get('sessionId'):
-                            async with session.delete(f"{base_url}/sessions/{result['sessionId']}") as cleanup_response:
-                                pass
-                    else:
-                        print(f"   ❌ {session_type_config['description']}: Failed (Status: {response.status})")
-            except Exception as e:
-                print(f"   ❌ {session_type_config['description']}: Error - {e}")
-        
         # Test 3: Notification settings
-        print("\n3. Testing Notification Settings:")
         notification_configs = [
             {"details": True, "links": True, "description": "Full notifications"},
             {"details": True, "links": False, "description": "Details only"},
@@ -90,44 +134,7 @@ async def test_settings_integration():
             {"details": False, "links": False, "description": "Minimal notifications"}
         ]
         
-        for notify_config in notification_configs:
-            session_data = {
-                "sessionType": {"type": "MANUAL"},
-                "strictness": 0.5,
-                "notify": notify_config
-            }
-            
-            try:
-                async with session.post(
-                    f"{base_url}/sessions", 
-                    json=session_data,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        print(f"   ✅ {notify_config['description']}: Created successfully")
-                        
-                        # Verify settings are preserved
-                        returned_settings = result.get('settings', {})
-                        returned_notify = returned_settings.get('notify', {})
-                        
-                        if (returned_notify.get('details') == notify_config['details'] and 
-                            returned_notify.get('links') == notify_config['links']):
-                            print(f"      ✅ Settings preserved correctly")
-                        else:
-                            print(f"      ⚠️  Settings mismatch: Expected {notify_config}, Got {returned_notify}")
-                        
-                        # Clean up session
-                        if result.get('sessionId'):
-                            async with session.delete(f"{base_url}/sessions/{result['sessionId']}") as cleanup_response:
-                                pass
-                    else:
-                        print(f"   ❌ {notify_config['description']}: Failed (Status: {response.status})")
-            except Exception as e:
-                print(f"   ❌ {notify_config['description']}: Error - {e}")
-        
         # Test 4: Edge cases and validation
-        print("\n4. Testing Edge Cases:")
         edge_cases = [
             {
                 "name": "Invalid strictness (negative)",
@@ -151,38 +158,114 @@ async def test_settings_integration():
             }
         ]
         
-        for test_case in edge_cases:
-            try:
-                async with session.post(
-                    f"{base_url}/sessions", 
-                    json=test_case["data"],
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if test_case["expect_fail"]:
-                        if response.status != 200:
-                            print(f"   ✅ {test_case['name']}: Correctly rejected (Status: {response.status})")
-                        else:
-                            print(f"   ⚠️  {test_case['name']}: Should have been rejected but was accepted")
-                            result = await response.json()
-                            if result.get('sessionId'):
-                                async with session.delete(f"{base_url}/sessions/{result['sessionId']}") as cleanup_response:
-                                    pass
-                    else:
-                        if response.status == 200:
-                            print(f"   ✅ {test_case['name']}: Correctly accepted")
-                            result = await response.json()
-                            if result.get('sessionId'):
-                                async with session.delete(f"{base_url}/sessions/{result['sessionId']}") as cleanup_response:
-                                    pass
-                        else:
-                            print(f"   ❌ {test_case['name']}: Should have been accepted but was rejected (Status: {response.status})")
-            except Exception as e:
+        # The sections are independent, so all four batches run concurrently;
+        # results come back in case order and are reported section by section
+        strictness_results, type_results, notify_results, edge_results = await asyncio.gather(
+            run_section([{**base_overrides, "strictness": strictness} for strictness in strictness_levels], template_id),
+            run_section([{**base_overrides, "sessionType": config} for config in session_types], template_id),
+            run_section([{**base_overrides, "notify": config} for config in notification_configs], template_id),
+            run_section(
+                [test_case["data"] for test_case in edge_cases],
+                persistent_index=next(i for i, test_case in enumerate(edge_cases) if not test_case["expect_fail"])
+            )
+        )
+        
+        # Case lines are buffered and written once per section
+        log = []
+        
+        print("\n1. Testing Strictness Levels (Backend Validation):")
+        for strictness, outcome in zip(strictness_levels, strictness_results):
+            if isinstance(outcome, Exception):
+                log.append(f"   ❌ Strictness {strictness}: Error - {outcome}\n")
+                continue
+            status, session_id, result = outcome
+            if status == 200:
+                log.append(f"   ✅ Strictness {strictness}: Session created (ID: {(session_id or 'Unknown')[:8]}...)\n")
+            else:
+                log.append(f"   ❌ Strictness {strictness}: Failed (Status: {status})\n")
+        
+        sys.stdout.write("".join(log))
+        log.clear()
+        
+        print("\n2. Testing Session Types:")
+        for session_type_config, outcome in zip(session_types, type_results):
+            if isinstance(outcome, Exception):
+                log.append(f"   ❌ {session_type_config['description']}: Error - {outcome}\n")
+                continue
+            status, session_id, result = outcome
+            if status == 200:
+                log.append(f"   ✅ {session_type_config['description']}: Created successfully\n")
+            else:
+                log.append(f"   ❌ {session_type_config['description']}: Failed (Status: {status})\n")
+        
+        sys.stdout.write("".join(log))
+        log.clear()
+        
+        print("\n3. Testing Notification Settings:")
+        for notify_config, outcome in zip(notification_configs, notify_results):
+            if isinstance(outcome, Exception):
+                log.append(f"   ❌ {notify_config['description']}: Error - {outcome}\n")
+                continue
+            status, session_id, result = outcome
+            if status == 200:
+                log.append(f"   ✅ {notify_config['description']}: Created successfully\n")
+                
+                # Verify settings are preserved
+                returned_settings = result.get('settings', {})
+                returned_notify = returned_settings.get('notify', {})
+                
+                if (returned_notify.get('details') == notify_config['details'] and 
+                    returned_notify.get('links') == notify_config['links']):
+                    log.append(f"      ✅ Settings preserved correctly\n")
+                else:
+                    log.append(f"      ⚠️  Settings mismatch: Expected {notify_config}, Got {returned_notify}\n")
+            else:
+                log.append(f"   ❌ {notify_config['description']}: Failed (Status: {status})\n")
+        
+        sys.stdout.write("".join(log))
+        log.clear()
+        
+        print("\n4. Testing Edge Cases:")
+        for test_case, outcome in zip(edge_cases, edge_results):
+            if isinstance(outcome, Exception):
                 if test_case["expect_fail"]:
-                    print(f"   ✅ {test_case['name']}: Correctly failed with error - {e}")
+                    log.append(f"   ✅ {test_case['name']}: Correctly failed with error - {outcome}\n")
                 else:
-                    print(f"   ❌ {test_case['name']}: Unexpected error - {e}")
+                    log.append(f"   ❌ {test_case['name']}: Unexpected error - {outcome}\n")
+                continue
+            status, session_id, result = outcome
+            if test_case["expect_fail"]:
+                if status != 200:
+                    log.append(f"   ✅ {test_case['name']}: Correctly rejected (Status: {status})\n")
+                else:
+                    log.append(f"   ⚠️  {test_case['name']}: Should have been rejected but was accepted\n")
+            else:
+                if status == 200:
+                    log.append(f"   ✅ {test_case['name']}: Correctly accepted\n")
+                else:
+                    log.append(f"   ❌ {test_case['name']}: Should have been accepted but was rejected (Status: {status})\n")
+
+        sys.stdout.write("".join(log))
+        log.clear()
+
+        # Clean up sessions
+        if created_ids:
+            try:
+                async with session.delete(
+                    batch_url,
+                    data=orjson.dumps({"session_ids": created_ids}),
+                    timeout=cleanup_timeout
+                ) as cleanup_response:
+                    pass
+            except Exception as e:
+                print(f"\n⚠️  Cleanup of {len(created_ids)} sessions failed - {e}")
 
         print("\n✅ Settings integration testing complete!")
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Linux/macOS only
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(test_settings_integration())